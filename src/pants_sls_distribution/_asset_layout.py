@@ -11,12 +11,13 @@ Assembles the directory tree for an SLS asset distribution (product-type: asset.
 """
 
 from dataclasses import dataclass, field
+from itertools import repeat
 from typing import List, Optional
 
 from pants_sls_distribution._layout import LayoutFile, LayoutDirectory, SlsLayout
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AssetMapping:
     """A mapping from source file to destination path in the asset directory."""
 
@@ -57,8 +58,12 @@ def build_asset_layout(
     layout.add_directory("asset")
 
     if asset_mappings:
-        for mapping in asset_mappings:
-            dest = f"asset/{mapping.dest_path}"
-            layout.add_file(dest, source_path=mapping.source_path)
+        layout.add_files(
+            zip(
+                map("asset/".__add__, [m.dest_path for m in asset_mappings]),
+                [m.source_path for m in asset_mappings],
+                repeat(None),
+            )
+        )
 
     return layout
@@ -12,8 +12,11 @@ Three modes (mutually exclusive):
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Tuple
 
+from pants_sls_distribution._template import compile_template
+
 
 class CheckMode(str, Enum):
     """Health check mode."""
@@ -24,7 +27,7 @@ class CheckMode(str, Enum):
     NONE = "none"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CheckScriptResult:
     """Result of check script generation."""
 
@@ -93,6 +96,15 @@ cd "$DIST_ROOT"
 exec {check_command}
 """
 
+_render_check_args_script = compile_template(
+    _CHECK_ARGS_SCRIPT.lstrip("\n"),
+    ("service_name",),
+)
+_render_check_command_script = compile_template(
+    _CHECK_COMMAND_SCRIPT.lstrip("\n"),
+    ("service_name", "check_command"),
+)
+
 
 def generate_check_script(
     *,
@@ -104,7 +116,7 @@ def generate_check_script(
     """Generate the appropriate health check configuration.
 
     Exactly one of check_args, check_command, or check_script_path should be set,
-    or none for no health checks.
+    or none for no health checks. Results are memoized per input.
 
     Args:
         service_name: Product name.
@@ -115,18 +127,36 @@ def generate_check_script(
     Returns:
         CheckScriptResult with the generated content and mode.
     """
-    set_count = sum(1 for v in [check_args, check_command, check_script_path] if v is not None)
+    set_count = (
+        (check_args is not None)
+        + (check_command is not None)
+        + (check_script_path is not None)
+    )
     if set_count > 1:
         raise ValueError(
             "Only one of check_args, check_command, or check_script_path may be set."
         )
 
+    return _generate_check_script(
+        service_name,
+        tuple(check_args) if check_args is not None else None,
+        check_command,
+        check_script_path,
+    )
+
+
+@lru_cache(maxsize=256)
+def _generate_check_script(
+    service_name: str,
+    check_args: Optional[Tuple[str, ...]],
+    check_command: Optional[str],
+    check_script_path: Optional[str],
+) -> CheckScriptResult:
+    """Memoized body of generate_check_script (exclusivity already checked)."""
     if check_args is not None:
         # Mode 1: check_args - generate check.sh that invokes launcher --check
         # The launcher-check.yml is generated separately by _launcher_config
-        content = _CHECK_ARGS_SCRIPT.format(
-            service_name=service_name,
-        ).lstrip("\n")
+        content = _render_check_args_script(service_name=service_name)
         return CheckScriptResult(
             mode=CheckMode.CHECK_ARGS,
             check_script_content=content,
@@ -134,10 +164,10 @@ def generate_check_script(
 
     if check_command is not None:
         # Mode 2: check_command - generate check.sh that runs the command
-        content = _CHECK_COMMAND_SCRIPT.format(
+        content = _render_check_command_script(
             service_name=service_name,
             check_command=check_command,
-        ).lstrip("\n")
+        )
         return CheckScriptResult(
             mode=CheckMode.CHECK_COMMAND,
             check_script_content=content,
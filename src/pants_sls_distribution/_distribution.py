@@ -0,0 +1,195 @@
+"""Pure Python SLS distribution writer (no Pants dependencies).
+
+Materializes an ``SlsLayout`` under ``dist/`` and writes its
+``<dist_name>.sls.tgz`` tarball in the same pass.
+"""
+
+import io
+import os
+import posixpath
+import threading
+import time
+import uuid
+from collections import Counter
+from itertools import chain
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Protocol
+
+from pants_sls_distribution._layout import SlsLayout
+
+if TYPE_CHECKING:
+    import tarfile
+
+
+class DistributionFile(Protocol):
+    """A file with in-memory content, e.g. a Pants ``FileContent``."""
+
+    path: str
+    content: bytes
+
+
+def duplicate_dist_names(layouts: Iterable[SlsLayout]) -> list[str]:
+    """Return the sorted dist names produced by more than one layout.
+
+    Distributions with the same name are written to the same paths, so
+    they cannot be written concurrently (or meaningfully at all).
+    """
+    counts = Counter(layout.dist_name for layout in layouts)
+    return sorted(name for name, count in counts.items() if count > 1)
+
+
+def write_distribution(
+    layout: SlsLayout,
+    extra_files: Iterable[DistributionFile],
+    dist_dir: Path,
+    *,
+    hardlink_sources: bool = False,
+) -> Path:
+    """Write one distribution tree under dist_dir and its tarball; return the tarball path.
+
+    Each entry is added to the tarball from the bytes (or source file) it
+    is written from, so the tree is never read back to build the archive.
+
+    Args:
+        layout: The distribution layout to write.
+        extra_files: Executable files to add at their ``path`` (the launcher
+            binaries).
+        dist_dir: Directory receiving ``<dist_name>/`` and its tarball.
+        hardlink_sources: Hardlink source files into the tree instead of
+            copying them. The tree stays in dist_dir, and a linked file
+            shares its inode with the source: editing it in place edits the
+            source.
+    """
+    # Imported here, not at module level: register.py loads every goal
+    # module on each Pants run, and only sls-package writes archives.
+    import shutil
+    import tarfile
+
+    extra_files = tuple(extra_files)
+    output_root = dist_dir / layout.dist_name
+
+    # Clean previous output: move it aside (a single rename) and delete it
+    # in the background while the new tree is written. The thread is not a
+    # daemon, so the deletion still completes before the process exits.
+    if output_root.exists():
+        trash = dist_dir / f".trash-{os.getpid()}-{uuid.uuid4().hex}"
+        os.rename(output_root, trash)
+        threading.Thread(
+            target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}
+        ).start()
+
+    # Every directory the distribution needs: the root, declared directories
+    # and the parents of every file. Sorted, so parents precede children;
+    # each is created once and no per-file mkdir is needed below.
+    archive_dirs = {""}
+    for directory in chain(
+        (d.relative_path for d in layout.directories),
+        (posixpath.dirname(f.relative_path) for f in layout.files),
+        (posixpath.dirname(fc.path) for fc in extra_files),
+    ):
+        while directory not in archive_dirs:
+            archive_dirs.add(directory)
+            directory = posixpath.dirname(directory)
+    sorted_dirs = sorted(archive_dirs)
+
+    # Create directories. mkdir applies the umask, so each is chmod-ed to
+    # the 0755 its tarball entry records.
+    output_root.mkdir(parents=True)
+    os.chmod(output_root, 0o755)
+    for relative_path in sorted_dirs[1:]:
+        directory_path = output_root / relative_path
+        directory_path.mkdir()
+        os.chmod(directory_path, 0o755)
+
+    mtime = int(time.time())
+    tarball_path = dist_dir / f"{layout.dist_name}.sls.tgz"
+    # gzip level 6 (gzip's own default) is several times faster than
+    # tarfile's default of 9 for a marginally larger archive.
+    with tarfile.open(tarball_path, "w:gz", compresslevel=6) as tar:
+        for relative_path in sorted_dirs:
+            info = tarfile.TarInfo(posixpath.join(layout.dist_name, relative_path).rstrip("/"))
+            info.type = tarfile.DIRTYPE
+            info.mode = 0o755
+            info.mtime = mtime
+            tar.addfile(info)
+
+        # Write files
+        for f in layout.files:
+            file_path = output_root / f.relative_path
+            arcname = f"{layout.dist_name}/{f.relative_path}"
+
+            # Files written here get a umask-dependent mode, so they are set
+            # to the fixed 0755/0644 their tarball entry records. Sources are
+            # archived with the mode of the file in the tree: copies keep the
+            # source's mode (+x added for executables), and hardlinked
+            # sources are never chmod-ed, since that would change the source.
+            if f.content is not None:
+                data = f.content
+                if isinstance(data, str):
+                    data = data.encode("utf-8")
+                file_path.write_bytes(data)
+                os.chmod(file_path, 0o755 if f.executable else 0o644)
+                _add_bytes(tar, arcname, data, executable=f.executable, mtime=mtime)
+            elif f.source_path is not None:
+                linked = hardlink_sources and _hardlink(
+                    f.source_path, file_path, executable=f.executable
+                )
+                if not linked:
+                    shutil.copy2(f.source_path, file_path)
+                    if f.executable:
+                        os.chmod(file_path, os.stat(file_path).st_mode | 0o111)
+                with open(file_path, "rb") as written:
+                    # Stat the opened file, not the path: a symlinked source
+                    # (common for Pants inputs) must be archived as the
+                    # regular file it points to, as it is in the tree.
+                    info = tar.gettarinfo(arcname=arcname, fileobj=written)
+                    info.mtime = mtime
+                    tar.addfile(info, written)
+
+        # Write launcher binaries from Pants digest
+        for file_content in extra_files:
+            dest = output_root / file_content.path
+            dest.write_bytes(file_content.content)
+            os.chmod(dest, 0o755)
+            _add_bytes(
+                tar,
+                f"{layout.dist_name}/{file_content.path}",
+                file_content.content,
+                executable=True,
+                mtime=mtime,
+            )
+
+    return tarball_path
+
+
+def _hardlink(source: str, dest: Path, *, executable: bool) -> bool:
+    """Hardlink source to dest; return False where a copy is needed instead.
+
+    A link shares the source's inode, so an executable entry whose source
+    lacks +x is not linked: the chmod it needs must not touch the source.
+    """
+    if executable and os.stat(source).st_mode & 0o111 != 0o111:
+        return False
+    try:
+        os.link(source, dest)
+    except OSError:  # cross-device, unsupported filesystem, permissions
+        return False
+    return True
+
+
+def _add_bytes(
+    tar: "tarfile.TarFile",
+    arcname: str,
+    data: bytes,
+    *,
+    executable: bool,
+    mtime: int,
+) -> None:
+    """Add an in-memory regular file to an open tarball."""
+    import tarfile
+
+    info = tarfile.TarInfo(arcname)
+    info.size = len(data)
+    info.mode = 0o755 if executable else 0o644
+    info.mtime = mtime
+    tar.addfile(info, io.BytesIO(data))
@@ -9,7 +9,11 @@ Hook phases:
     pre-shutdown  -> shutdown   -> [EXIT]
 """
 
-import re
+import string
+from functools import lru_cache
+from typing import Final, Iterable, Optional
+
+from pants_sls_distribution._template import compile_template
 
 HOOK_PHASES = (
     "pre-configure",
@@ -21,18 +25,14 @@ HOOK_PHASES = (
     "shutdown",
 )
 
-_HOOK_PATH_RE = re.compile(
-    r"^(?P<phase>[a-z-]+)\.d/(?P<name>[a-zA-Z0-9_.-]+\.sh)$"
-)
-
+_HOOK_PHASE_SET = frozenset(HOOK_PHASES)
 
-def get_entrypoint_script() -> str:
-    """Return the embedded entrypoint.sh content.
+# Character classes for ``<phase>.d/<name>.sh`` hook keys.
+_PHASE_CHARS = frozenset(string.ascii_lowercase + "-")
+_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_.-")
 
-    Adapted from the hook init system so SERVICE_ROOT auto-detects
-    the distribution root from the ``service/bin/`` location.
-    """
-    return '''\
+# service/bin/entrypoint.sh, copied verbatim into distributions and Docker contexts.
+_ENTRYPOINT_SH: Final[str] = '''\
 #!/bin/sh
 # entrypoint.sh — Container lifecycle entrypoint (POSIX sh compatible)
 #
@@ -213,10 +213,8 @@ else
 fi
 '''
 
-
-def get_hooks_library() -> str:
-    """Return the embedded hooks.sh library content."""
-    return '''\
+# service/lib/hooks.sh, sourced by entrypoint.sh.
+_HOOKS_SH: Final[str] = '''\
 #!/bin/sh
 # hooks.sh — Core hook execution library (POSIX sh compatible)
 #
@@ -387,13 +385,35 @@ run_hooks_warn() {
 }
 '''
 
+_ENTRYPOINT_SH_BYTES: Final[bytes] = _ENTRYPOINT_SH.encode("utf-8")
+_HOOKS_SH_BYTES: Final[bytes] = _HOOKS_SH.encode("utf-8")
 
-def generate_startup_script(service_name: str) -> str:
-    """Generate the startup.d/00-main.sh script.
 
-    Starts the python-service-launcher in the background and writes PID.
+def get_entrypoint_script() -> str:
+    """Return the embedded entrypoint.sh content.
+
+    Adapted from the hook init system so SERVICE_ROOT auto-detects
+    the distribution root from the ``service/bin/`` location.
     """
-    return f'''\
+    return _ENTRYPOINT_SH
+
+
+def get_hooks_library() -> str:
+    """Return the embedded hooks.sh library content."""
+    return _HOOKS_SH
+
+
+def get_entrypoint_script_bytes() -> bytes:
+    """Return the embedded entrypoint.sh content as UTF-8 bytes."""
+    return _ENTRYPOINT_SH_BYTES
+
+
+def get_hooks_library_bytes() -> bytes:
+    """Return the embedded hooks.sh library content as UTF-8 bytes."""
+    return _HOOKS_SH_BYTES
+
+
+_STARTUP_SCRIPT_TEMPLATE = '''\
 #!/bin/sh
 # Auto-generated: Start python-service-launcher for {service_name}
 set -eu
@@ -407,25 +427,53 @@ LAUNCHER="${{SERVICE_ROOT}}/service/bin/${{os}}-${{arch}}/python-service-launche
 echo $! > "${{HOOK_STATE_DIR}}/main.pid"
 '''
 
+_render_startup_script = compile_template(_STARTUP_SCRIPT_TEMPLATE, ("service_name",))
+
+
+@lru_cache(maxsize=256)
+def generate_startup_script(service_name: str) -> str:
+    """Generate the startup.d/00-main.sh script.
 
-def validate_hook_paths(hooks: dict[str, str]) -> None:
+    Starts the python-service-launcher in the background and writes PID.
+    """
+    return _render_startup_script(service_name=service_name)
+
+
+def _parse_hook_phase(key: str) -> Optional[str]:
+    """Return the phase of a ``<phase>.d/<name>.sh`` key, or None if malformed."""
+    phase_dir, sep, name = key.partition("/")
+    phase = phase_dir[:-2]
+    if (
+        sep
+        and phase_dir.endswith(".d")
+        and phase
+        # Known phases satisfy the character class; only scan unknown ones
+        and (phase in _HOOK_PHASE_SET or _PHASE_CHARS.issuperset(phase))
+        and len(name) > 3
+        and name.endswith(".sh")
+        and _NAME_CHARS.issuperset(name)
+    ):
+        return phase
+    return None
+
+
+def validate_hook_paths(hooks: Iterable[str]) -> None:
     """Validate that hook keys match ``<phase>.d/<name>.sh`` pattern.
 
     Args:
-        hooks: Mapping of hook paths to source file paths.
+        hooks: Hook paths, or a mapping of hook paths to source file paths.
 
     Raises:
         ValueError: If any key has an invalid format or unknown phase.
     """
     for key in hooks:
-        match = _HOOK_PATH_RE.match(key)
-        if not match:
+        phase = _parse_hook_phase(key)
+        if phase is None:
             raise ValueError(
                 f"Invalid hook path '{key}': must match '<phase>.d/<name>.sh' "
                 f"(e.g., 'pre-startup.d/10-migrate.sh')"
             )
-        phase = match.group("phase")
-        if phase not in HOOK_PHASES:
+        if phase not in _HOOK_PHASE_SET:
             raise ValueError(
                 f"Unknown hook phase '{phase}' in '{key}'. "
                 f"Valid phases: {', '.join(HOOK_PHASES)}"
@@ -6,6 +6,10 @@ python-service-launcher for the current platform/architecture.
 Based on python-service-launcher/scripts/init.sh.
 """
 
+from functools import lru_cache
+
+from pants_sls_distribution._template import compile_bytes_template, compile_template
+
 # The init.sh template uses bash with strict mode.
 # It detects the platform/arch, locates the python-service-launcher binary,
 # and supports start/stop/console/status/restart commands.
@@ -176,7 +180,17 @@ case "${{1:-}}" in
 esac
 """
 
+_render_init_script = compile_template(
+    _INIT_SCRIPT_TEMPLATE.lstrip("\n"),
+    ("service_name", "shutdown_timeout"),
+)
+_render_init_script_bytes = compile_bytes_template(
+    _INIT_SCRIPT_TEMPLATE.lstrip("\n"),
+    ("service_name", "shutdown_timeout"),
+)
 
+
+@lru_cache(maxsize=256)
 def generate_init_script(
     *,
     service_name: str,
@@ -184,6 +198,8 @@ def generate_init_script(
 ) -> str:
     """Generate init.sh content for an SLS distribution.
 
+    Results are memoized per (service_name, shutdown_timeout).
+
     Args:
         service_name: Product name (used for PID file, log file, display).
         shutdown_timeout: Seconds to wait for graceful shutdown before SIGKILL.
@@ -191,7 +207,24 @@ def generate_init_script(
     Returns:
         Complete init.sh script content.
     """
-    return _INIT_SCRIPT_TEMPLATE.format(
+    return _render_init_script(
+        service_name=service_name,
+        shutdown_timeout=shutdown_timeout,
+    )
+
+
+@lru_cache(maxsize=256)
+def generate_init_script_bytes(
+    *,
+    service_name: str,
+    shutdown_timeout: int = 30,
+) -> bytes:
+    """Generate init.sh content as UTF-8 bytes, ready to write to disk.
+
+    Same output as ``generate_init_script(...).encode("utf-8")``, but only
+    the substituted values are encoded per call.
+    """
+    return _render_init_script_bytes(
         service_name=service_name,
         shutdown_timeout=shutdown_timeout,
-    ).lstrip("\n")
+    )
@@ -4,6 +4,9 @@ Constants and helpers for the python-service-launcher Go binary that
 is bundled into SLS distributions for all supported platforms.
 """
 
+from functools import lru_cache
+from typing import Optional
+
 LAUNCHER_BINARY_NAME = "python-service-launcher"
 
 LAUNCHER_PLATFORMS: tuple[tuple[str, str], ...] = (
@@ -13,6 +16,16 @@ LAUNCHER_PLATFORMS: tuple[tuple[str, str], ...] = (
     ("linux", "arm64"),
 )
 
+# Precomputed per-platform strings for the fixed LAUNCHER_PLATFORMS table.
+_LAYOUT_PATHS: dict[tuple[str, str], str] = {
+    (os_name, arch): f"service/bin/{os_name}-{arch}/{LAUNCHER_BINARY_NAME}"
+    for os_name, arch in LAUNCHER_PLATFORMS
+}
+_ASSET_NAMES: dict[tuple[str, str], str] = {
+    (os_name, arch): f"{LAUNCHER_BINARY_NAME}-{os_name}-{arch}"
+    for os_name, arch in LAUNCHER_PLATFORMS
+}
+
 
 def launcher_layout_path(os_name: str, arch: str) -> str:
     """Return the relative path within the SLS layout for a launcher binary.
@@ -20,7 +33,10 @@ def launcher_layout_path(os_name: str, arch: str) -> str:
     Example: launcher_layout_path("linux", "amd64")
              -> "service/bin/linux-amd64/python-service-launcher"
     """
-    return f"service/bin/{os_name}-{arch}/{LAUNCHER_BINARY_NAME}"
+    try:
+        return _LAYOUT_PATHS[(os_name, arch)]
+    except KeyError:
+        return f"service/bin/{os_name}-{arch}/{LAUNCHER_BINARY_NAME}"
 
 
 def launcher_asset_name(os_name: str, arch: str) -> str:
@@ -29,4 +45,33 @@ def launcher_asset_name(os_name: str, arch: str) -> str:
     Example: launcher_asset_name("linux", "amd64")
              -> "python-service-launcher-linux-amd64"
     """
-    return f"{LAUNCHER_BINARY_NAME}-{os_name}-{arch}"
+    try:
+        return _ASSET_NAMES[(os_name, arch)]
+    except KeyError:
+        return f"{LAUNCHER_BINARY_NAME}-{os_name}-{arch}"
+
+
+@lru_cache(maxsize=8)
+def parse_known_versions(
+    entries: tuple[str, ...],
+) -> dict[tuple[str, str, str], Optional[tuple[str, str]]]:
+    """Index 'version|os|arch|sha256|size' entries by (version, os, arch).
+
+    Malformed entries (not five fields) are skipped. Placeholder hashes
+    (starting with '<') map to None. When a key repeats, the first entry
+    wins. The size is kept as the raw string.
+
+    Example: parse_known_versions(("v0.1.0|linux|amd64|abc123|42",))
+             -> {("v0.1.0", "linux", "amd64"): ("abc123", "42")}
+    """
+    table: dict[tuple[str, str, str], Optional[tuple[str, str]]] = {}
+    for entry in entries:
+        parts = entry.split("|")
+        if len(parts) != 5:
+            continue
+        ver, entry_os, entry_arch, sha256, size_str = parts
+        table.setdefault(
+            (ver, entry_os, entry_arch),
+            None if sha256.startswith("<") else (sha256, size_str),
+        )
+    return table
@@ -5,16 +5,52 @@ from python-service-launcher/launchlib/config.go.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
-import yaml
 
+def _pyyaml_dump(mapping: dict[str, Any]) -> str:
+    """Dump with PyYAML's safe dumper (C-accelerated when available).
 
-@dataclass(frozen=True)
+    PyYAML is imported here rather than at module level, so importing this
+    module does not load it.
+    """
+    import yaml
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml.dump(
+        mapping,
+        Dumper=dumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+    )
+
+
+# Go YAML keys of the always-emitted sub-sections, in emission order.
+_MEMORY_KEYS = (
+    "mode",
+    "maxRssPercent",
+    "heapFragmentationBuffer",
+    "mallocTrimThreshold",
+    "mallocArenaMax",
+)
+_RESOURCE_KEYS = ("maxOpenFiles", "maxProcesses", "coreDumpEnabled")
+_WATCHDOG_KEYS = (
+    "enabled",
+    "pollIntervalSeconds",
+    "softLimitPercent",
+    "hardLimitPercent",
+    "gracePeriodSeconds",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class LauncherConfig:
     """Mirrors python-service-launcher's StaticLauncherConfig.
 
     YAML keys use camelCase to match the Go struct tags exactly.
+    Slotted: instances carry no per-instance ``__dict__``.
     """
 
     # Required
@@ -69,43 +105,38 @@ class LauncherConfig:
             config["dirs"] = list(self.dirs)
 
         # Memory config
-        config["memory"] = {
-            "mode": self.memory_mode,
-            "maxRssPercent": self.memory_max_rss_percent,
-            "heapFragmentationBuffer": self.memory_heap_fragmentation_buffer,
-            "mallocTrimThreshold": self.memory_malloc_trim_threshold,
-            "mallocArenaMax": self.memory_malloc_arena_max,
-        }
+        config["memory"] = dict(zip(_MEMORY_KEYS, (
+            self.memory_mode,
+            self.memory_max_rss_percent,
+            self.memory_heap_fragmentation_buffer,
+            self.memory_malloc_trim_threshold,
+            self.memory_malloc_arena_max,
+        )))
 
         # Resource limits
-        config["resources"] = {
-            "maxOpenFiles": self.max_open_files,
-            "maxProcesses": self.max_processes,
-            "coreDumpEnabled": self.core_dump_enabled,
-        }
+        config["resources"] = dict(zip(_RESOURCE_KEYS, (
+            self.max_open_files,
+            self.max_processes,
+            self.core_dump_enabled,
+        )))
 
         # Watchdog
-        config["watchdog"] = {
-            "enabled": self.watchdog_enabled,
-            "pollIntervalSeconds": self.watchdog_poll_interval_seconds,
-            "softLimitPercent": self.watchdog_soft_limit_percent,
-            "hardLimitPercent": self.watchdog_hard_limit_percent,
-            "gracePeriodSeconds": self.watchdog_grace_period_seconds,
-        }
+        config["watchdog"] = dict(zip(_WATCHDOG_KEYS, (
+            self.watchdog_enabled,
+            self.watchdog_poll_interval_seconds,
+            self.watchdog_soft_limit_percent,
+            self.watchdog_hard_limit_percent,
+            self.watchdog_grace_period_seconds,
+        )))
 
         return config
 
     def to_yaml(self) -> str:
         """Serialize to YAML string."""
-        return yaml.dump(
-            self.to_dict(),
-            default_flow_style=False,
-            sort_keys=False,
-            allow_unicode=True,
-        )
+        return _pyyaml_dump(self.to_dict())
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CheckLauncherConfig:
     """Launcher config for health check mode (launcher-check.yml).
 
@@ -128,12 +159,7 @@ class CheckLauncherConfig:
         return config
 
     def to_yaml(self) -> str:
-        return yaml.dump(
-            self.to_dict(),
-            default_flow_style=False,
-            sort_keys=False,
-            allow_unicode=True,
-        )
+        return _pyyaml_dump(self.to_dict())
 
 
 def build_launcher_config(
@@ -161,6 +187,50 @@ def build_launcher_config(
     )
 
 
+def render_launcher_static_yaml(
+    *,
+    service_name: str,
+    executable: str,
+    entry_point: Optional[str] = None,
+    args: tuple[str, ...] = (),
+    env: Optional[Dict[str, str]] = None,
+    python_version: str = "3.11",
+) -> str:
+    """Render launcher-static.yml for sls_service target fields.
+
+    Equivalent to ``build_launcher_config(...).to_yaml()``, memoized per
+    input so repeated packaging of the same target reuses the rendered text.
+    """
+    return _render_launcher_static_yaml(
+        service_name,
+        executable,
+        entry_point,
+        tuple(args),
+        tuple(env.items()) if env else (),
+        python_version,
+    )
+
+
+@lru_cache(maxsize=128)
+def _render_launcher_static_yaml(
+    service_name: str,
+    executable: str,
+    entry_point: Optional[str],
+    args: tuple[str, ...],
+    env_items: tuple[tuple[str, str], ...],
+    python_version: str,
+) -> str:
+    """Memoized body of render_launcher_static_yaml (env as ordered items)."""
+    return build_launcher_config(
+        service_name=service_name,
+        executable=executable,
+        entry_point=entry_point,
+        args=args,
+        env=dict(env_items),
+        python_version=python_version,
+    ).to_yaml()
+
+
 def build_check_launcher_config(
     *,
     executable: str,
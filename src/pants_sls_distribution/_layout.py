@@ -22,26 +22,36 @@ Assembles the complete directory tree for an SLS distribution:
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Iterable, Mapping, NamedTuple, Optional, Union
 
+from pants_sls_distribution._hooks import HOOK_PHASES
 
-@dataclass(frozen=True)
-class LayoutFile:
+
+class LayoutFile(NamedTuple):
     """A file to be placed in the SLS distribution layout."""
 
     relative_path: str  # Path relative to dist root
-    content: Optional[str] = None  # Text content (mutually exclusive with source_path)
+    # Inline content, text or pre-encoded UTF-8 (mutually exclusive with source_path)
+    content: Optional[Union[str, bytes]] = None
     source_path: Optional[str] = None  # Path to copy from (for binaries or user scripts)
     executable: bool = False  # Whether to set +x permission
 
 
-@dataclass(frozen=True)
-class LayoutDirectory:
+class LayoutDirectory(NamedTuple):
     """A directory to create in the SLS distribution layout."""
 
     relative_path: str
 
 
+# Directories created when the hook init system is enabled: one per
+# lifecycle phase, then state and metrics directories for the hook system.
+_HOOK_INIT_DIRS = (
+    *(LayoutDirectory(f"hooks/{phase}.d") for phase in HOOK_PHASES),
+    LayoutDirectory("var/state"),
+    LayoutDirectory("var/metrics"),
+)
+
+
 @dataclass
 class SlsLayout:
     """Complete SLS distribution layout specification.
@@ -59,7 +69,7 @@ class SlsLayout:
         self,
         relative_path: str,
         *,
-        content: Optional[str] = None,
+        content: Optional[Union[str, bytes]] = None,
         source_path: Optional[str] = None,
         executable: bool = False,
     ) -> None:
@@ -72,6 +82,28 @@ class SlsLayout:
             )
         )
 
+    def add_files(
+        self,
+        entries: Iterable[tuple[str, Optional[str], Optional[str]]],
+        *,
+        executable: bool = False,
+    ) -> None:
+        """Add many files in one pass.
+
+        Args:
+            entries: ``(relative_path, source_path, content)`` tuples.
+            executable: Whether to set +x permission on every added file.
+        """
+        self.files.extend(
+            LayoutFile(
+                relative_path=relative_path,
+                content=content,
+                source_path=source_path,
+                executable=executable,
+            )
+            for relative_path, source_path, content in entries
+        )
+
     def add_directory(self, relative_path: str) -> None:
         self.directories.append(LayoutDirectory(relative_path=relative_path))
 
@@ -82,15 +114,15 @@ def build_layout(
     product_version: str,
     manifest_yaml: str,
     launcher_static_yaml: str,
-    init_script: str,
+    init_script: Union[str, bytes],
     check_script_content: Optional[str] = None,
     check_script_source: Optional[str] = None,
     launcher_check_yaml: Optional[str] = None,
     lock_file_content: Optional[str] = None,
-    hook_entrypoint_content: Optional[str] = None,
-    hook_library_content: Optional[str] = None,
+    hook_entrypoint_content: Optional[Union[str, bytes]] = None,
+    hook_library_content: Optional[Union[str, bytes]] = None,
     hook_startup_content: Optional[str] = None,
-    hook_scripts: Optional[Dict[str, str]] = None,
+    hook_scripts: Optional[Mapping[str, str]] = None,
 ) -> SlsLayout:
     """Build the complete SLS distribution layout.
 
@@ -99,103 +131,78 @@ def build_layout(
         product_version: SLS product version.
         manifest_yaml: Content of deployment/manifest.yml.
         launcher_static_yaml: Content of service/bin/launcher-static.yml.
-        init_script: Content of service/bin/init.sh.
+        init_script: Content of service/bin/init.sh (text or UTF-8 bytes).
         check_script_content: Generated check.sh content (check_args or check_command mode).
         check_script_source: Path to user-provided check.sh (check_script mode).
         launcher_check_yaml: Content of launcher-check.yml (check_args mode only).
         lock_file_content: Content of product-dependencies.lock (if deps exist).
-        hook_entrypoint_content: Content of service/bin/entrypoint.sh (hook init system).
-        hook_library_content: Content of service/lib/hooks.sh (hook library).
+        hook_entrypoint_content: Content of service/bin/entrypoint.sh (hook init
+            system; text or UTF-8 bytes).
+        hook_library_content: Content of service/lib/hooks.sh (hook library; text
+            or UTF-8 bytes).
         hook_startup_content: Content of hooks/startup.d/00-main.sh (auto-generated).
         hook_scripts: User hook scripts as {hooks/<phase>.d/<name>.sh: source_path}.
 
     Returns:
         SlsLayout with all files and directories.
     """
-    dist_name = f"{product_name}-{product_version}"
-    layout = SlsLayout(dist_name=dist_name)
-
-    # --- Runtime directories ---
-    layout.add_directory("var/data/tmp")
-    layout.add_directory("var/log")
-    layout.add_directory("var/run")
-
-    # --- deployment/ ---
-    layout.add_file("deployment/manifest.yml", content=manifest_yaml)
-
-    if lock_file_content is not None:
-        layout.add_file("deployment/product-dependencies.lock", content=lock_file_content)
-
-    # --- service/bin/ ---
-    layout.add_file("service/bin/init.sh", content=init_script, executable=True)
-    layout.add_file("service/bin/launcher-static.yml", content=launcher_static_yaml)
-
-    # --- Launcher check config (check_args mode) ---
-    if launcher_check_yaml is not None:
-        layout.add_file("service/bin/launcher-check.yml", content=launcher_check_yaml)
-
-    # --- service/monitoring/bin/check.sh ---
-    if check_script_content is not None:
-        layout.add_file(
-            "service/monitoring/bin/check.sh",
-            content=check_script_content,
-            executable=True,
-        )
-    elif check_script_source is not None:
-        layout.add_file(
-            "service/monitoring/bin/check.sh",
-            source_path=check_script_source,
-            executable=True,
-        )
-
-    # --- Hook init system ---
-    if hook_entrypoint_content is not None:
-        layout.add_file(
-            "service/bin/entrypoint.sh",
-            content=hook_entrypoint_content,
-            executable=True,
-        )
-
-    if hook_library_content is not None:
-        layout.add_file("service/lib/hooks.sh", content=hook_library_content)
-
-    if hook_entrypoint_content is not None:
-        # Create all 7 hook phase directories
-        from pants_sls_distribution._hooks import HOOK_PHASES
-
-        for phase in HOOK_PHASES:
-            layout.add_directory(f"hooks/{phase}.d")
-
-        # State and metrics directories for the hook system
-        layout.add_directory("var/state")
-        layout.add_directory("var/metrics")
-
-    if hook_startup_content is not None:
-        layout.add_file(
-            "hooks/startup.d/00-main.sh",
-            content=hook_startup_content,
-            executable=True,
-        )
-
-    if hook_scripts:
-        for hook_path, source_path in hook_scripts.items():
-            layout.add_file(
-                f"hooks/{hook_path}",
-                source_path=source_path,
-                executable=True,
-            )
-
-    return layout
-
-
-def layout_to_file_map(layout: SlsLayout) -> dict[str, str]:
+    use_hook_init = hook_entrypoint_content is not None
+
+    directories = [
+        # --- Runtime directories ---
+        LayoutDirectory("var/data/tmp"),
+        LayoutDirectory("var/log"),
+        LayoutDirectory("var/run"),
+    ]
+    if use_hook_init:
+        directories.extend(_HOOK_INIT_DIRS)
+
+    # (relative_path, content, source_path, executable, include) rows, in
+    # layout order; only rows whose include flag is set become files.
+    file_spec = (
+        # --- deployment/ ---
+        ("deployment/manifest.yml", manifest_yaml, None, False, True),
+        ("deployment/product-dependencies.lock", lock_file_content, None, False,
+         lock_file_content is not None),
+        # --- service/bin/ ---
+        ("service/bin/init.sh", init_script, None, True, True),
+        ("service/bin/launcher-static.yml", launcher_static_yaml, None, False, True),
+        # --- Launcher check config (check_args mode) ---
+        ("service/bin/launcher-check.yml", launcher_check_yaml, None, False,
+         launcher_check_yaml is not None),
+        # --- service/monitoring/bin/check.sh (generated wins over user-provided) ---
+        ("service/monitoring/bin/check.sh", check_script_content, None, True,
+         check_script_content is not None),
+        ("service/monitoring/bin/check.sh", None, check_script_source, True,
+         check_script_content is None and check_script_source is not None),
+        # --- Hook init system ---
+        ("service/bin/entrypoint.sh", hook_entrypoint_content, None, True, use_hook_init),
+        ("service/lib/hooks.sh", hook_library_content, None, False,
+         hook_library_content is not None),
+        ("hooks/startup.d/00-main.sh", hook_startup_content, None, True,
+         hook_startup_content is not None),
+    )
+    files = [
+        LayoutFile(relative_path, content, source_path, executable)
+        for relative_path, content, source_path, executable, include in file_spec
+        if include
+    ]
+    files.extend(
+        LayoutFile(f"hooks/{hook_path}", source_path=source_path, executable=True)
+        for hook_path, source_path in (hook_scripts or {}).items()
+    )
+
+    return SlsLayout(
+        dist_name=f"{product_name}-{product_version}",
+        files=files,
+        directories=directories,
+    )
+
+
+def layout_to_file_map(layout: SlsLayout) -> dict[str, Union[str, bytes]]:
     """Convert a layout to a flat dict of {relative_path: content}.
 
     Only includes files with inline content (not source_path references).
     Useful for testing and inspection.
     """
-    result: dict[str, str] = {}
-    for f in layout.files:
-        if f.content is not None:
-            result[f.relative_path] = f.content
-    return result
+    return {f.relative_path: f.content for f in layout.files if f.content is not None}
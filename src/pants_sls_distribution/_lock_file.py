@@ -12,7 +12,7 @@ Format::
 """
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Sequence, Tuple, Union
 
 from pants_sls_distribution._types import ProductDependency
@@ -24,14 +24,15 @@ _LOCK_HEADER = (
 )
 
 # Parse: group:name (min, max)[ optional]
+# Groups, in order: group, name, min, max, optional
 _LOCK_LINE_PATTERN = re.compile(
-    r"^(?P<group>[a-z0-9.-]+):(?P<name>[a-z][a-z0-9.-]*)"
-    r"\s+\((?P<min>[^,]+),\s*(?P<max>[^)]+)\)"
-    r"(?:\s+(?P<optional>optional))?\s*$"
+    r"^([a-z0-9.-]+):([a-z][a-z0-9.-]*)"
+    r"\s+\(([^,]+),\s*([^)]+)\)"
+    r"(?:\s+(optional))?\s*$"
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LockEntry:
     """A single entry in a product-dependencies.lock file."""
 
@@ -40,10 +41,14 @@ class LockEntry:
     minimum_version: str
     maximum_version: str
     optional: bool = False
+    _product_id: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_product_id", f"{self.product_group}:{self.product_name}")
 
     @property
     def product_id(self) -> str:
-        return f"{self.product_group}:{self.product_name}"
+        return self._product_id
 
     def to_line(self) -> str:
         """Serialize to a single lock file line."""
@@ -79,12 +84,8 @@ def generate_lock_file(dependencies: Union[Tuple[ProductDependency, ...], List[P
     # Sort for deterministic output
     entries.sort(key=lambda e: e.product_id)
 
-    lines = [_LOCK_HEADER]
-    for entry in entries:
-        lines.append(entry.to_line())
-
-    # Trailing newline
-    return "\n".join(lines) + "\n"
+    # Header, one line per entry, trailing newline
+    return "\n".join((_LOCK_HEADER, *map(LockEntry.to_line, entries))) + "\n"
 
 
 def parse_lock_file(content: str) -> list[LockEntry]:
@@ -101,8 +102,10 @@ def parse_lock_file(content: str) -> list[LockEntry]:
     """
     entries = []
     for line_num, line in enumerate(content.splitlines(), start=1):
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
+        # Only lines with leading whitespace need stripping; the pattern
+        # already tolerates trailing whitespace.
+        stripped = line.strip() if line[:1].isspace() else line
+        if not stripped or stripped[0] == "#":
             continue
 
         match = _LOCK_LINE_PATTERN.match(stripped)
@@ -111,12 +114,13 @@ def parse_lock_file(content: str) -> list[LockEntry]:
                 f"Invalid lock file line {line_num}: {line!r}"
             )
 
+        group, name, min_version, max_version, optional = match.groups()
         entries.append(LockEntry(
-            product_group=match.group("group"),
-            product_name=match.group("name"),
-            minimum_version=match.group("min").strip(),
-            maximum_version=match.group("max").strip(),
-            optional=match.group("optional") is not None,
+            product_group=group,
+            product_name=name,
+            minimum_version=min_version.strip(),
+            maximum_version=max_version.strip(),
+            optional=optional is not None,
         ))
 
     return entries
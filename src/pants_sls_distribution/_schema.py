@@ -0,0 +1,123 @@
+"""Pure Python manifest JSON schema validation (no Pants dependencies).
+
+Validates manifest dicts against the bundled ``schemas/manifest.v1.json``.
+jsonschema reports every error; fastjsonschema (the optional ``fast`` extra),
+when installed, accepts valid manifests through a compiled check first.
+"""
+
+from collections.abc import Mapping
+from functools import lru_cache
+from importlib import resources as importlib_resources
+from typing import Any, Callable, Optional
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional
+    from json import loads as _json_loads
+
+
+@lru_cache(maxsize=1)
+def load_manifest_schema() -> dict[str, Any]:
+    """Load the manifest.v1.json schema from bundled resources (parsed once)."""
+    schema_path = (
+        importlib_resources.files("pants_sls_distribution")
+        / "schemas"
+        / "manifest.v1.json"
+    )
+    return _json_loads(schema_path.read_bytes())
+
+
+def build_schema_validators() -> None:
+    """Build the cached validators now, ahead of the first validation."""
+    _manifest_schema_validator()
+    _compiled_manifest_schema()
+
+
+@lru_cache(maxsize=1)
+def _manifest_schema_validator() -> Optional[Any]:
+    """Build the manifest schema validator once; None without jsonschema."""
+    try:
+        import jsonschema
+    except ImportError:
+        return None
+
+    # to_dict() leaves FrozenDict and tuple fields uncopied; treat any Mapping
+    # as an object and tuples as arrays.
+    type_checker = jsonschema.Draft7Validator.TYPE_CHECKER.redefine_many({
+        "object": lambda checker, instance: isinstance(instance, Mapping),
+        "array": lambda checker, instance: isinstance(instance, (list, tuple)),
+    })
+    validator_cls = jsonschema.validators.extend(
+        jsonschema.Draft7Validator, type_checker=type_checker
+    )
+    return validator_cls(load_manifest_schema())
+
+
+@lru_cache(maxsize=1)
+def _compiled_manifest_schema() -> Optional[Callable[[Any], Any]]:
+    """Compile the manifest schema with fastjsonschema once; None if absent."""
+    try:
+        import fastjsonschema
+    except ImportError:
+        return None
+    # use_default=False: filling in schema defaults would write into the
+    # manifest's shared, read-only data_dict.
+    return fastjsonschema.compile(load_manifest_schema(), use_default=False)
+
+
+def _to_json_types(value: Any) -> Any:
+    """Return value with non-dict Mappings (FrozenDict) converted to dicts.
+
+    fastjsonschema has no type-checker hook: its generated code tests objects
+    with ``isinstance(data, dict)`` (arrays accept tuples). Only the
+    FrozenDict fields and the containers holding them are copied; plain
+    dicts, lists and tuples without one are returned as-is.
+    """
+    if isinstance(value, Mapping):
+        copied = None if isinstance(value, dict) else dict(value)
+        for k, v in value.items():
+            converted = _to_json_types(v)
+            if converted is not v:
+                if copied is None:
+                    copied = dict(value)
+                copied[k] = converted
+        return value if copied is None else copied
+    if isinstance(value, (list, tuple)):
+        copied_items = None
+        for i, v in enumerate(value):
+            converted = _to_json_types(v)
+            if converted is not v:
+                if copied_items is None:
+                    copied_items = list(value)
+                copied_items[i] = converted
+        return value if copied_items is None else copied_items
+    return value
+
+
+def validate_against_schema(manifest_dict: Mapping[str, Any]) -> tuple[list[str], list[str]]:
+    """Validate manifest dict against the JSON schema. Returns (errors, warnings)."""
+    validator = _manifest_schema_validator()
+    if validator is None:
+        return [], ["jsonschema package not available; skipping schema validation"]
+
+    # Fast path: a compiled fastjsonschema check, when available, accepts
+    # valid manifests without walking the schema. It stops at the first
+    # error, so failures are re-run through jsonschema to report them all.
+    compiled = _compiled_manifest_schema()
+    if compiled is not None:
+        import fastjsonschema
+
+        try:
+            compiled(_to_json_types(manifest_dict))
+        except fastjsonschema.JsonSchemaException:
+            pass
+        else:
+            return [], []
+
+    errors = [
+        f"Schema: [{'.'.join(map(str, error.absolute_path))}] {error.message}"
+        if error.absolute_path
+        else f"Schema: {error.message}"
+        for error in validator.iter_errors(manifest_dict)
+    ]
+    return errors, []
@@ -0,0 +1,86 @@
+"""Pure Python shell template compilation (no Pants dependencies).
+
+Script templates keep ``str.format`` syntax (``{field}`` placeholders with
+``{{``/``}}`` escapes) so they stay readable next to the shell they produce,
+but are parsed once at import time. Rendering a compiled template is a single
+``str.join`` over the precomputed literal segments and substituted values.
+"""
+
+from string import Formatter
+from typing import Callable
+
+
+def _split_template(
+    raw: str, fields: tuple[str, ...]
+) -> tuple[str, tuple[tuple[str, str], ...]]:
+    """Split a template into its leading literal and (field, literal) pairs."""
+    literals: list[str] = []
+    names: list[str] = []
+    pending = ""
+    for literal, name, spec, conversion in Formatter().parse(raw):
+        pending += literal
+        if name is None:
+            continue
+        if name not in fields:
+            raise ValueError(f"Unknown template placeholder {{{name}}}; expected one of {fields}")
+        if spec or conversion:
+            raise ValueError(f"Template placeholder {{{name}}} must not use a conversion or format spec")
+        literals.append(pending)
+        names.append(name)
+        pending = ""
+
+    head = literals[0] if literals else pending
+    segments = tuple(zip(names, literals[1:] + [pending])) if names else ()
+    return head, segments
+
+
+def compile_template(raw: str, fields: tuple[str, ...]) -> Callable[..., str]:
+    """Compile a ``str.format``-style template into a keyword-only renderer.
+
+    Args:
+        raw: Template text. ``{{`` and ``}}`` are unescaped to literal braces.
+        fields: Placeholder names the template may reference. Each may appear
+            any number of times.
+
+    Returns:
+        A function taking the fields as keyword arguments and returning the
+        rendered string. Values are converted with ``str()``.
+
+    Raises:
+        ValueError: If the template uses an unknown placeholder, a positional
+            placeholder, or a conversion/format spec.
+    """
+    head, segments = _split_template(raw, fields)
+
+    def render(**values: object) -> str:
+        subs = {name: str(values[name]) for name in fields}
+        parts = [head]
+        for name, literal in segments:
+            parts.append(subs[name])
+            parts.append(literal)
+        return "".join(parts)
+
+    return render
+
+
+def compile_bytes_template(
+    raw: str, fields: tuple[str, ...], encoding: str = "utf-8"
+) -> Callable[..., bytes]:
+    """Compile a template like ``compile_template``, rendering to ``bytes``.
+
+    Literal segments are encoded once at compile time; only the substituted
+    values are encoded per call.
+    """
+    head, segments = _split_template(raw, fields)
+    encoded_head = head.encode(encoding)
+    encoded_segments = tuple((name, literal.encode(encoding)) for name, literal in segments)
+
+    def render(**values: object) -> bytes:
+        subs = {name: str(values[name]).encode(encoding) for name in fields}
+        parts = [encoded_head]
+        for name, literal in encoded_segments:
+            parts.append(subs[name])
+            parts.append(literal)
+        return b"".join(parts)
+
+    return render
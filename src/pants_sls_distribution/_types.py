@@ -16,14 +16,11 @@ class ProductType(str, Enum):
     SERVICE_V1 = "service.v1"
 
 
-# SLS orderable version patterns.
+# SLS orderable version pattern.
 # Matches: 1.0.0, 1.0.0-rc1, 1.0.0-5-gabcdef, 1.0.0-rc1-5-gabcdef
-ORDERABLE_VERSION_PATTERNS = [
-    re.compile(r"^[0-9]+\.[0-9]+\.[0-9]+$"),
-    re.compile(r"^[0-9]+\.[0-9]+\.[0-9]+-rc[0-9]+$"),
-    re.compile(r"^[0-9]+\.[0-9]+\.[0-9]+-[0-9]+-g[a-f0-9]+$"),
-    re.compile(r"^[0-9]+\.[0-9]+\.[0-9]+-rc[0-9]+-[0-9]+-g[a-f0-9]+$"),
-]
+ORDERABLE_VERSION_PATTERN = re.compile(
+    r"^[0-9]+\.[0-9]+\.[0-9]+(?:-rc[0-9]+)?(?:-[0-9]+-g[a-f0-9]+)?$"
+)
 
 # Maven-style product group: lowercase letters, digits, dots, hyphens.
 PRODUCT_GROUP_PATTERN = re.compile(r"^[a-z0-9.-]+$")
@@ -31,27 +28,31 @@ PRODUCT_GROUP_PATTERN = re.compile(r"^[a-z0-9.-]+$")
 # Product name: starts with lowercase letter, then lowercase letters, digits, dots, hyphens.
 PRODUCT_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9.-]*$")
 
-# Version matcher for maximum-version (allows x wildcards).
-VERSION_MATCHER_PATTERN = re.compile(
-    r"^[0-9x]+\.[0-9x]+\.[0-9x]+$"
-    r"|^[0-9]+\.[0-9]+\.[0-9]+$"
-)
+# Version matcher for maximum-version (allows x wildcards). Plain X.Y.Z
+# versions are a subset of the wildcard form, so one branch covers both.
+VERSION_MATCHER_PATTERN = re.compile(r"^[0-9x]+\.[0-9x]+\.[0-9x]+$")
+
+
+# Bound match methods, so the validators below skip the attribute lookups.
+_match_orderable_version = ORDERABLE_VERSION_PATTERN.match
+_match_product_group = PRODUCT_GROUP_PATTERN.match
+_match_product_name = PRODUCT_NAME_PATTERN.match
 
 
 def is_orderable_version(version: str) -> bool:
-    """Check if a version string matches any SLS orderable version pattern."""
-    return any(p.match(version) for p in ORDERABLE_VERSION_PATTERNS)
+    """Check if a version string matches the SLS orderable version pattern."""
+    return _match_orderable_version(version) is not None
 
 
 def is_valid_product_group(group: str) -> bool:
-    return bool(PRODUCT_GROUP_PATTERN.match(group))
+    return _match_product_group(group) is not None
 
 
 def is_valid_product_name(name: str) -> bool:
-    return bool(PRODUCT_NAME_PATTERN.match(name))
+    return _match_product_name(name) is not None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProductDependency:
     """A resolved product dependency for manifest generation."""
 
@@ -61,10 +62,14 @@ class ProductDependency:
     maximum_version: Optional[str] = None
     recommended_version: Optional[str] = None
     optional: bool = False
+    _product_id: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_product_id", f"{self.product_group}:{self.product_name}")
 
     @property
     def product_id(self) -> str:
-        return f"{self.product_group}:{self.product_name}"
+        return self._product_id
 
     def to_manifest_dict(self) -> dict[str, Any]:
         """Serialize to the SLS manifest extensions format."""
@@ -81,7 +86,7 @@ class ProductDependency:
         return result
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProductIncompatibility:
     """A product incompatibility declaration."""
 
@@ -99,7 +104,7 @@ class ProductIncompatibility:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Artifact:
     """An artifact reference (OCI image, etc.)."""
 
@@ -117,7 +122,7 @@ class Artifact:
         return result
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ManifestData:
     """Complete manifest data ready for YAML serialization."""
 
@@ -141,13 +146,24 @@ class ManifestData:
     product_incompatibilities: tuple[ProductIncompatibility, ...] = ()
     artifacts: tuple[Artifact, ...] = ()
     extensions: FrozenDict[str, Any] = FrozenDict()
+    _product_id: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_product_id", f"{self.product_group}:{self.product_name}")
 
     @property
     def product_id(self) -> str:
-        return f"{self.product_group}:{self.product_name}"
+        return self._product_id
 
     def to_dict(self) -> dict[str, Any]:
-        """Serialize to the manifest YAML structure."""
+        """Serialize to the manifest YAML structure.
+
+        Mapping fields (labels, annotations, resources, replication) and the
+        endpoint/volume/secret tuples are passed through as-is rather than
+        copied, so the result may contain ``FrozenDict`` and ``tuple``
+        values. Dump it with a YAML dumper that represents those as a
+        mapping and a sequence.
+        """
         manifest: dict[str, Any] = {
             "manifest-version": self.manifest_version,
             "product-type": self.product_type,
@@ -163,27 +179,27 @@ class ManifestData:
         if self.traits:
             manifest["traits"] = list(self.traits)
         if self.labels:
-            manifest["labels"] = dict(self.labels)
+            manifest["labels"] = self.labels
         if self.annotations:
-            manifest["annotations"] = dict(self.annotations)
+            manifest["annotations"] = self.annotations
 
         if self.resource_requests or self.resource_limits:
             resources: dict[str, Any] = {}
             if self.resource_requests:
-                resources["requests"] = dict(self.resource_requests)
+                resources["requests"] = self.resource_requests
             if self.resource_limits:
-                resources["limits"] = dict(self.resource_limits)
+                resources["limits"] = self.resource_limits
             manifest["resources"] = resources
 
         if self.replication:
-            manifest["replication"] = dict(self.replication)
+            manifest["replication"] = self.replication
 
         if self.endpoints:
-            manifest["endpoints"] = [dict(e) for e in self.endpoints]
+            manifest["endpoints"] = self.endpoints
         if self.volumes:
-            manifest["volumes"] = [dict(v) for v in self.volumes]
+            manifest["volumes"] = self.volumes
         if self.secrets:
-            manifest["secrets"] = [dict(s) for s in self.secrets]
+            manifest["secrets"] = self.secrets
 
         # Build extensions
         extensions = dict(self.extensions)
@@ -4,6 +4,8 @@ These are extracted so they can be tested without the Pants runtime.
 The rules/manifest.py and rules/validation.py modules call into these.
 """
 
+from collections import Counter
+
 from pants_sls_distribution._exceptions import ManifestValidationError
 from pants_sls_distribution._types import (
     ManifestData,
@@ -13,6 +15,8 @@ from pants_sls_distribution._types import (
     is_valid_product_name,
 )
 
+_VALID_PRODUCT_TYPES = frozenset({"helm.v1", "asset.v1", "service.v1"})
+
 
 def validate_dependency(dep: ProductDependency) -> None:
     """Validate product dependency semantics."""
@@ -52,9 +56,8 @@ def validate_dependency(dep: ProductDependency) -> None:
 
 def validate_replication(replication) -> None:
     """Validate replication constraints: min <= desired <= max."""
-    desired = replication.get("desired")
-    min_val = replication.get("min")
-    max_val = replication.get("max")
+    get = replication.get
+    desired, min_val, max_val = get("desired"), get("min"), get("max")
 
     if min_val is not None and desired is not None and min_val > desired:
         raise ManifestValidationError(
@@ -107,49 +110,62 @@ def resolve_default_max_version(minimum_version: str) -> str:
     return f"{major}.x.x"
 
 
-def validate_manifest_data(data: ManifestData) -> tuple[list[str], list[str]]:
-    """Validate a complete ManifestData. Returns (errors, warnings)."""
+def validate_manifest_data(
+    data: ManifestData,
+    *,
+    validate_identity: bool = True,
+) -> tuple[list[str], list[str]]:
+    """Validate a complete ManifestData. Returns (errors, warnings).
+
+    Pass ``validate_identity=False`` when the product group, name and version
+    have already been checked by ``validate_manifest_identity`` (as
+    generate_manifest does for every SlsManifest).
+    """
     errors: list[str] = []
     warnings: list[str] = []
 
-    # Required fields
-    if not data.product_group:
-        errors.append("product-group is required")
-    if not data.product_name:
-        errors.append("product-name is required")
-    if not data.product_version:
-        errors.append("product-version is required")
+    if validate_identity:
+        # Required fields
+        if not data.product_group:
+            errors.append("product-group is required")
+        if not data.product_name:
+            errors.append("product-name is required")
+        if not data.product_version:
+            errors.append("product-version is required")
+
+        # Version format
+        if data.product_version and not is_orderable_version(data.product_version):
+            errors.append(
+                f"product-version {data.product_version!r} is not a valid SLS orderable version"
+            )
+
     if not data.product_type:
         errors.append("product-type is required")
 
-    # Version format
-    if data.product_version and not is_orderable_version(data.product_version):
+    # Product type
+    if data.product_type and data.product_type not in _VALID_PRODUCT_TYPES:
         errors.append(
-            f"product-version {data.product_version!r} is not a valid SLS orderable version"
+            f"product-type {data.product_type!r} not in {sorted(_VALID_PRODUCT_TYPES)}"
         )
 
-    # Product type
-    valid_types = {"helm.v1", "asset.v1", "service.v1"}
-    if data.product_type and data.product_type not in valid_types:
-        errors.append(f"product-type {data.product_type!r} not in {valid_types}")
-
     # Replication semantics
     if data.replication:
-        desired = data.replication.get("desired")
-        min_val = data.replication.get("min")
-        max_val = data.replication.get("max")
+        get = data.replication.get
+        desired, min_val, max_val = get("desired"), get("min"), get("max")
         if min_val is not None and desired is not None and min_val > desired:
             errors.append(f"replication.min ({min_val}) > replication.desired ({desired})")
         if desired is not None and max_val is not None and desired > max_val:
             errors.append(f"replication.desired ({desired}) > replication.max ({max_val})")
 
     # Dependency validation
-    seen_dep_ids: set[str] = set()
+    dep_id_counts = Counter(dep.product_id for dep in data.product_dependencies)
+    errors.extend(
+        f"Duplicate product dependency: {dep_id} (appears {count} times)"
+        for dep_id, count in dep_id_counts.items()
+        if count > 1
+    )
     for dep in data.product_dependencies:
         dep_id = dep.product_id
-        if dep_id in seen_dep_ids:
-            errors.append(f"Duplicate product dependency: {dep_id}")
-        seen_dep_ids.add(dep_id)
 
         if not is_orderable_version(dep.minimum_version):
             errors.append(f"Dependency {dep_id}: invalid minimum_version {dep.minimum_version!r}")
@@ -1,18 +1,18 @@
 """sls-docker goal: generate Dockerfiles and optionally build images."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from pants.engine.console import Console
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule
-from pants.engine.target import FilteredTargets
 
 from pants_sls_distribution.rules.docker import (
     SlsDockerRequest,
     SlsDockerResult,
 )
-from pants_sls_distribution.rules.manifest import SlsManifestFieldSet
-from pants_sls_distribution.targets import EntrypointField
+from pants_sls_distribution.rules.manifest import SlsManifestFieldSet, SlsServiceTargets
 
 
 class SlsDockerGoalSubsystem(GoalSubsystem):
@@ -28,9 +28,9 @@ class SlsDockerGoal(Goal):
 @goal_rule
 async def run_sls_docker(
     console: Console,
-    targets: FilteredTargets,
+    sls_service_targets: SlsServiceTargets,
 ) -> SlsDockerGoal:
-    sls_targets = [t for t in targets if t.has_field(EntrypointField)]
+    sls_targets = sls_service_targets.targets
 
     if not sls_targets:
         console.print_stderr("No sls_service targets found.")
@@ -46,42 +46,52 @@ async def run_sls_docker(
 
     dist_dir = Path("dist")
 
+    # Create every build-context directory and collect the files up front so
+    # the writes, which are independent, can run concurrently.
+    writes: list[tuple[Path, str]] = []
+    docker_dirs = []
     for result in results:
-        pkg = result.package_result
-        docker_dir = dist_dir / pkg.dist_name / "docker"
-        docker_dir.mkdir(parents=True, exist_ok=True)
-
-        # Write Dockerfile
-        dockerfile_path = docker_dir / "Dockerfile"
-        dockerfile_path.write_text(result.dockerfile_content, encoding="utf-8")
+        docker_dir = dist_dir / result.package_result.dist_name / "docker"
+        docker_dirs.append(docker_dir)
 
-        # Write .dockerignore
-        dockerignore_path = docker_dir / ".dockerignore"
-        dockerignore_path.write_text(result.dockerignore_content, encoding="utf-8")
+        # Dockerfile and .dockerignore
+        docker_dir.mkdir(parents=True, exist_ok=True)
+        writes.append((docker_dir / "Dockerfile", result.dockerfile_content))
+        writes.append((docker_dir / ".dockerignore", result.dockerignore_content))
 
-        # Write hook init system files for Docker build context
+        # Hook init system files for Docker build context
         if result.hook_entrypoint_content is not None:
             hooks_dir = docker_dir / "hooks"
             hooks_dir.mkdir(parents=True, exist_ok=True)
+            writes.append((hooks_dir / "entrypoint.sh", result.hook_entrypoint_content))
+            writes.append((hooks_dir / "hooks.sh", result.hook_library_content))
+
+    with ThreadPoolExecutor() as executor:
+        list(
+            executor.map(
+                partial(Path.write_text, encoding="utf-8"),
+                (path for path, _ in writes),
+                (content for _, content in writes),
+            )
+        )
 
-            entrypoint_path = hooks_dir / "entrypoint.sh"
-            entrypoint_path.write_text(result.hook_entrypoint_content, encoding="utf-8")
-
-            library_path = hooks_dir / "hooks.sh"
-            library_path.write_text(result.hook_library_content, encoding="utf-8")
-
+    for result, docker_dir in zip(results, docker_dirs):
+        pkg = result.package_result
+        if result.hook_entrypoint_content is not None:
             console.print_stdout(
-                f"  Hook init system: {hooks_dir}"
+                f"  Hook init system: {docker_dir / 'hooks'}"
             )
 
-        image_tag = f"{pkg.product_name}:{pkg.product_version}"
         console.print_stdout(
-            f"Generated Dockerfile: {dockerfile_path} "
-            f"(image: {image_tag})"
+            f"Generated Dockerfile: {docker_dir / 'Dockerfile'} "
+            f"(image: {pkg.image_tag})"
         )
 
     return SlsDockerGoal(exit_code=0)
 
 
+_RULES = tuple(collect_rules())
+
+
 def rules():
-    return collect_rules()
+    return _RULES
@@ -1,18 +1,18 @@
 """sls-lock goal: generate product-dependencies.lock files."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from pants.engine.console import Console
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule
-from pants.engine.target import FilteredTargets
 
 from pants_sls_distribution.rules.dependencies import (
     SlsLockFileRequest,
     SlsLockFileResult,
 )
-from pants_sls_distribution.rules.manifest import SlsManifestFieldSet
-from pants_sls_distribution.targets import EntrypointField
+from pants_sls_distribution.rules.manifest import SlsManifestFieldSet, SlsServiceTargets
 
 
 class SlsLockGoalSubsystem(GoalSubsystem):
@@ -28,9 +28,9 @@ class SlsLockGoal(Goal):
 @goal_rule
 async def run_sls_lock(
     console: Console,
-    targets: FilteredTargets,
+    sls_service_targets: SlsServiceTargets,
 ) -> SlsLockGoal:
-    sls_targets = [t for t in targets if t.has_field(EntrypointField)]
+    sls_targets = sls_service_targets.targets
 
     if not sls_targets:
         console.print_stderr("No sls_service targets found.")
@@ -46,20 +46,35 @@ async def run_sls_lock(
 
     dist_dir = Path("dist")
 
-    for result in results:
+    # Write lock files alongside the manifest, in dist/<product-name>/deployment/
+    lock_paths = [
+        dist_dir / result.product_id.split(":")[-1] / "deployment" / "product-dependencies.lock"
+        for result in results
+    ]
+    to_write = [
+        (path, result) for path, result in zip(lock_paths, results) if result.dependency_count
+    ]
+    for output_dir in {path.parent for path, _ in to_write}:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Lock files are independent; write them concurrently, then report in
+    # target order.
+    with ThreadPoolExecutor() as executor:
+        list(
+            executor.map(
+                partial(Path.write_text, encoding="utf-8"),
+                (path for path, _ in to_write),
+                (result.content for _, result in to_write),
+            )
+        )
+
+    for result, lock_path in zip(results, lock_paths):
         if result.dependency_count == 0:
             console.print_stdout(
                 f"No dependencies for {result.product_id} (skipping lock file)"
             )
             continue
 
-        # Write lock file alongside the manifest
-        product_name = result.product_id.split(":")[-1]
-        output_dir = dist_dir / product_name / "deployment"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        lock_path = output_dir / "product-dependencies.lock"
-        lock_path.write_text(result.content, encoding="utf-8")
-
         console.print_stdout(
             f"Generated lock file: {lock_path} "
             f"({result.product_id}, {result.dependency_count} dependencies)"
@@ -68,5 +83,8 @@ async def run_sls_lock(
     return SlsLockGoal(exit_code=0)
 
 
+_RULES = tuple(collect_rules())
+
+
 def rules():
-    return collect_rules()
+    return _RULES
@@ -1,19 +1,18 @@
 """sls-manifest goal: generate deployment/manifest.yml for SLS targets."""
 
-import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from pants.engine.console import Console
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule
-from pants.engine.target import FilteredTargets
 
 from pants_sls_distribution.rules.manifest import (
     SlsManifest,
     SlsManifestFieldSet,
     SlsManifestRequest,
+    SlsServiceTargets,
 )
-from pants_sls_distribution.targets import EntrypointField
 
 
 class SlsManifestGoalSubsystem(GoalSubsystem):
@@ -29,9 +28,9 @@ class SlsManifestGoal(Goal):
 @goal_rule
 async def run_sls_manifest(
     console: Console,
-    targets: FilteredTargets,
+    sls_service_targets: SlsServiceTargets,
 ) -> SlsManifestGoal:
-    sls_targets = [t for t in targets if t.has_field(EntrypointField)]
+    sls_targets = sls_service_targets.targets
 
     if not sls_targets:
         console.print_stderr("No sls_service targets found.")
@@ -46,15 +45,27 @@ async def run_sls_manifest(
     )
 
     dist_dir = Path("dist")
-    dist_dir.mkdir(parents=True, exist_ok=True)
 
-    for manifest in manifests:
-        # Write to dist/<product-name>/deployment/manifest.yml
-        output_dir = dist_dir / manifest.data.product_name / "deployment"
+    # Write to dist/<product-name>/deployment/manifest.yml
+    output_paths = [
+        dist_dir / manifest.data.product_name / "deployment" / "manifest.yml"
+        for manifest in manifests
+    ]
+    for output_dir in {path.parent for path in output_paths}:
         output_dir.mkdir(parents=True, exist_ok=True)
-        output_path = output_dir / "manifest.yml"
-        output_path.write_text(manifest.content, encoding="utf-8")
 
+    # Manifests are independent files; write them concurrently, then report
+    # in target order.
+    with ThreadPoolExecutor() as executor:
+        list(
+            executor.map(
+                Path.write_bytes,
+                output_paths,
+                (manifest.content_bytes for manifest in manifests),
+            )
+        )
+
+    for manifest, output_path in zip(manifests, output_paths):
         console.print_stdout(
             f"Generated manifest: {output_path} "
             f"({manifest.product_id} v{manifest.product_version})"
@@ -63,5 +74,8 @@ async def run_sls_manifest(
     return SlsManifestGoal(exit_code=0)
 
 
+_RULES = tuple(collect_rules())
+
+
 def rules():
-    return collect_rules()
+    return _RULES
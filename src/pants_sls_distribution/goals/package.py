@@ -1,18 +1,18 @@
 """sls-package goal: assemble SLS distribution and write to dist/."""
 
-import os
-import shutil
-import tarfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import repeat
 from pathlib import Path
 
 from pants.engine.console import Console
 from pants.engine.fs import Digest, DigestContents
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule
-from pants.engine.target import FilteredTargets
+from pants.option.option_types import BoolOption
 
-from pants_sls_distribution.rules.manifest import SlsManifestFieldSet
-from pants_sls_distribution.targets import EntrypointField
+from pants_sls_distribution._distribution import duplicate_dist_names, write_distribution
+from pants_sls_distribution.rules.manifest import SlsManifestFieldSet, SlsServiceTargets
 from pants_sls_distribution.rules.package import (
     SlsPackageRequest,
     SlsPackageResult,
@@ -23,6 +23,16 @@ class SlsPackageGoalSubsystem(GoalSubsystem):
     name = "sls-package"
     help = "Package SLS service targets into distribution tarballs."
 
+    hardlink_sources = BoolOption(
+        default=False,
+        help=(
+            "Hardlink user-provided files (check and hook scripts) into the "
+            "dist/<dist-name>/ tree instead of copying them. The tree is left "
+            "in dist/, and a hardlinked file shares its inode with the source "
+            "file: editing it in place in dist/ also edits the source."
+        ),
+    )
+
 
 class SlsPackageGoal(Goal):
     subsystem_cls = SlsPackageGoalSubsystem
@@ -32,9 +42,10 @@ class SlsPackageGoal(Goal):
 @goal_rule
 async def run_sls_package(
     console: Console,
-    targets: FilteredTargets,
+    sls_service_targets: SlsServiceTargets,
+    subsystem: SlsPackageGoalSubsystem,
 ) -> SlsPackageGoal:
-    sls_targets = [t for t in targets if t.has_field(EntrypointField)]
+    sls_targets = sls_service_targets.targets
 
     if not sls_targets:
         console.print_stderr("No sls_service targets found.")
@@ -48,46 +59,41 @@ async def run_sls_package(
         for t in sls_targets
     )
 
-    dist_dir = Path("dist")
-
-    for result in results:
-        layout = result.layout
-        output_root = dist_dir / layout.dist_name
-
-        # Clean previous output
-        if output_root.exists():
-            shutil.rmtree(output_root)
-
-        # Create directories
-        for d in layout.directories:
-            (output_root / d.relative_path).mkdir(parents=True, exist_ok=True)
-
-        # Write files
-        for f in layout.files:
-            file_path = output_root / f.relative_path
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-
-            if f.content is not None:
-                file_path.write_text(f.content, encoding="utf-8")
-            elif f.source_path is not None:
-                shutil.copy2(f.source_path, file_path)
-
-            if f.executable:
-                file_path.chmod(file_path.stat().st_mode | 0o111)
+    # Each distribution is written to dist/<dist_name>, so two targets with
+    # the same product name and version would race on the same paths.
+    duplicates = duplicate_dist_names(result.layout for result in results)
+    if duplicates:
+        for dist_name in duplicates:
+            addresses = ", ".join(
+                str(t.address)
+                for t, result in zip(sls_targets, results)
+                if result.dist_name == dist_name
+            )
+            console.print_stderr(
+                f"Duplicate SLS distribution {dist_name!r} from targets: {addresses}"
+            )
+        return SlsPackageGoal(exit_code=1)
+
+    launcher_contents = await MultiGet(
+        Get(DigestContents, Digest, result.launcher_digest) for result in results
+    )
 
-        # Write launcher binaries from Pants digest
-        launcher_contents = await Get(DigestContents, Digest, result.launcher_digest)
-        for file_content in launcher_contents:
-            dest = output_root / file_content.path
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            dest.write_bytes(file_content.content)
-            dest.chmod(dest.stat().st_mode | 0o111)
+    dist_dir = Path("dist")
 
-        # Create tarball
-        tarball_path = dist_dir / f"{layout.dist_name}.sls.tgz"
-        with tarfile.open(tarball_path, "w:gz") as tar:
-            tar.add(str(output_root), arcname=layout.dist_name)
+    # Distributions are independent and their writes are I/O- and
+    # gzip-bound (zlib releases the GIL), so build them on worker threads.
+    write = partial(write_distribution, hardlink_sources=subsystem.hardlink_sources)
+    with ThreadPoolExecutor() as executor:
+        tarball_paths = list(
+            executor.map(
+                write,
+                (result.layout for result in results),
+                launcher_contents,
+                repeat(dist_dir),
+            )
+        )
 
+    for result, tarball_path in zip(results, tarball_paths):
         console.print_stdout(
             f"Packaged: {tarball_path} "
             f"({result.manifest.product_id} v{result.product_version})"
@@ -96,5 +102,8 @@ async def run_sls_package(
     return SlsPackageGoal(exit_code=0)
 
 
+_RULES = tuple(collect_rules())
+
+
 def rules():
-    return collect_rules()
+    return _RULES
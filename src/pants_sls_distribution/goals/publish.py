@@ -3,11 +3,9 @@
 from pants.engine.console import Console
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule
-from pants.engine.target import FilteredTargets
 from pants.option.option_types import BoolOption
 
-from pants_sls_distribution.rules.manifest import SlsManifestFieldSet
-from pants_sls_distribution.targets import EntrypointField
+from pants_sls_distribution.rules.manifest import SlsManifestFieldSet, SlsServiceTargets
 from pants_sls_distribution.rules.publish import (
     SlsPublishRequest,
     SlsPublishResult,
@@ -32,10 +30,10 @@ class SlsPublishGoal(Goal):
 @goal_rule
 async def run_sls_publish(
     console: Console,
-    targets: FilteredTargets,
+    sls_service_targets: SlsServiceTargets,
     subsystem: SlsPublishGoalSubsystem,
 ) -> SlsPublishGoal:
-    sls_targets = [t for t in targets if t.has_field(EntrypointField)]
+    sls_targets = sls_service_targets.targets
 
     if not sls_targets:
         console.print_stderr("No sls_service targets found.")
@@ -73,5 +71,8 @@ async def run_sls_publish(
     return SlsPublishGoal(exit_code=exit_code)
 
 
+_RULES = tuple(collect_rules())
+
+
 def rules():
-    return collect_rules()
+    return _RULES
@@ -3,17 +3,11 @@
 from pants.engine.console import Console
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule
-from pants.engine.target import FilteredTargets
 
-from pants_sls_distribution.rules.manifest import (
-    SlsManifest,
-    SlsManifestFieldSet,
-    SlsManifestRequest,
-)
-from pants_sls_distribution.targets import EntrypointField
+from pants_sls_distribution.rules.manifest import SlsManifestFieldSet, SlsServiceTargets
 from pants_sls_distribution.rules.validation import (
-    SlsValidationRequest,
-    SlsValidationResult,
+    SlsTargetValidation,
+    SlsTargetValidationRequest,
 )
 
 
@@ -30,37 +24,26 @@ class SlsValidateGoal(Goal):
 @goal_rule
 async def run_sls_validate(
     console: Console,
-    targets: FilteredTargets,
+    sls_service_targets: SlsServiceTargets,
 ) -> SlsValidateGoal:
-    sls_targets = [
-        t for t in targets
-        if t.has_field(EntrypointField)
-    ]
+    sls_targets = sls_service_targets.targets
 
     if not sls_targets:
         console.print_stderr("No sls_service targets found.")
         return SlsValidateGoal(exit_code=0)
 
-    # Generate manifests first
-    manifests = await MultiGet(
+    # Generate and validate each target's manifest
+    validations = await MultiGet(
         Get(
-            SlsManifest,
-            SlsManifestRequest(SlsManifestFieldSet.create(t)),
+            SlsTargetValidation,
+            SlsTargetValidationRequest(SlsManifestFieldSet.create(t)),
         )
         for t in sls_targets
     )
 
-    # Validate each manifest
-    results = await MultiGet(
-        Get(
-            SlsValidationResult,
-            SlsValidationRequest(manifest),
-        )
-        for manifest in manifests
-    )
-
     has_errors = False
-    for manifest, result in zip(manifests, results):
+    for validation in validations:
+        manifest, result = validation.manifest, validation.result
         if result.valid:
             console.print_stdout(f"PASS  {manifest.product_id} v{manifest.product_version}")
         else:
@@ -76,9 +59,12 @@ async def run_sls_validate(
         console.print_stderr("\nValidation failed.")
         return SlsValidateGoal(exit_code=1)
 
-    console.print_stdout(f"\nAll {len(manifests)} manifest(s) valid.")
+    console.print_stdout(f"\nAll {len(validations)} manifest(s) valid.")
     return SlsValidateGoal(exit_code=0)
 
 
+_RULES = tuple(collect_rules())
+
+
 def rules():
-    return collect_rules()
+    return _RULES
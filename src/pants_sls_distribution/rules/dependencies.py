@@ -20,14 +20,14 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlsLockFileRequest:
     """Request to generate a product-dependencies.lock file."""
 
     field_set: SlsManifestFieldSet
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlsLockFileResult:
     """Result of lock file generation."""
 
@@ -64,5 +64,8 @@ async def generate_sls_lock_file(
     )
 
 
+_RULES = tuple(collect_rules())
+
+
 def rules():
-    return collect_rules()
+    return _RULES
@@ -2,6 +2,7 @@
 
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from pants.engine.rules import Get, collect_rules, rule
@@ -30,14 +31,14 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlsDockerRequest:
     """Request to build a Docker image for an SLS distribution."""
 
     field_set: SlsManifestFieldSet
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlsDockerResult:
     """Result of Docker image generation (Dockerfile + context)."""
 
@@ -70,13 +71,14 @@ async def generate_docker_config(
     product_name = package_result.product_name
     product_version = package_result.product_version
     dist_name = package_result.dist_name
-    tarball_name = f"{dist_name}.sls.tgz"
 
     # Determine if health check is configured
     check_args = fs.check_args.value
     check_command = fs.check_command.value
     check_script_path = fs.check_script.value
-    has_health_check = any(v is not None for v in [check_args, check_command, check_script_path])
+    has_health_check = (
+        check_args is not None or check_command is not None or check_script_path is not None
+    )
 
     # Determine if hook init system is enabled
     hooks = fs.hooks.value
@@ -94,7 +96,7 @@ async def generate_docker_config(
         product_version=product_version,
         product_group=package_result.manifest.data.product_group,
         dist_name=dist_name,
-        tarball_name=tarball_name,
+        tarball_name=package_result.tarball_name,
         install_path=subsystem.install_path,
         product_type=package_result.manifest.data.product_type,
         health_check_interval=10 if has_health_check else None,
@@ -103,10 +105,9 @@ async def generate_docker_config(
     )
 
     dockerfile_content = dockerfile.render()
-    dockerignore_content = sls_dockerignore()
+    dockerignore_content = _sls_dockerignore()
 
-    image_tag = f"{product_name}:{product_version}"
-    logger.info("Generated Docker config for %s", image_tag)
+    logger.info("Generated Docker config for %s", package_result.image_tag)
 
     return SlsDockerResult(
         dockerfile_content=dockerfile_content,
@@ -118,5 +119,19 @@ async def generate_docker_config(
     )
 
 
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+@lru_cache(maxsize=1)
+def _sls_dockerignore() -> str:
+    """The standard SLS .dockerignore, which takes no inputs, rendered once."""
+    return sls_dockerignore()
+
+
+_RULES = tuple(collect_rules())
+
+
 def rules():
-    return collect_rules()
+    return _RULES
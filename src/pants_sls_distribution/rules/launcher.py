@@ -38,12 +38,18 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LauncherBinariesRequest:
-    """Request to download all platform launcher binaries."""
+    """Request to download all platform launcher binaries.
+
+    Deliberately field-free: every instance is equal, so the engine memoizes
+    a single LauncherBinariesResult per session no matter how many services
+    are packaged. The launcher version and URLs come from
+    PythonServiceLauncherSubsystem inside the rule; do not add them here.
+    """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LauncherBinariesResult:
     """Result containing a Digest with all 4 platform binaries.
 
@@ -60,7 +66,7 @@ class LauncherBinariesResult:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _SingleLauncherDownload:
     """Internal: request to download and place a single platform binary."""
 
@@ -70,7 +76,7 @@ class _SingleLauncherDownload:
     expected_digest: Optional[FileDigest]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _SingleLauncherResult:
     """Internal: result of downloading a single platform binary."""
 
@@ -86,22 +92,34 @@ class _SingleLauncherResult:
 async def _download_single_launcher(
     request: _SingleLauncherDownload,
 ) -> _SingleLauncherResult:
+    # The binary is marked executable here, per platform, so the merged
+    # digest never has to be read back and re-created.
     if request.expected_digest is not None:
         # Use DownloadFile with verified digest (preferred path)
-        downloaded = await Get(
+        fetched = await Get(
             Digest,
             DownloadFile(url=request.url, expected_digest=request.expected_digest),
         )
+        contents = await Get(DigestContents, Digest, fetched)
+        downloaded = await Get(
+            Digest,
+            CreateDigest(
+                [
+                    FileContent(path=fc.path, content=fc.content, is_executable=True)
+                    for fc in contents
+                ]
+            ),
+        )
     else:
         # Fall back to curl when digest is unknown (placeholder hashes)
         result = await Get(
             ProcessResult,
             Process(
                 argv=[
-                    "curl",
-                    "-fSL",
-                    "--retry", "3",
-                    "-o", LAUNCHER_BINARY_NAME,
+                    "sh",
+                    "-c",
+                    'curl -fSL --retry 3 -o "$0" "$1" && chmod +x "$0"',
+                    LAUNCHER_BINARY_NAME,
                     request.url,
                 ],
                 description=f"Download {launcher_asset_name(request.os_name, request.arch)}",
@@ -123,41 +141,33 @@ async def download_launcher_binaries(
     request: LauncherBinariesRequest,
     launcher_subsystem: PythonServiceLauncherSubsystem,
 ) -> LauncherBinariesResult:
-    # Download all platform binaries in parallel
-    single_results = await MultiGet(
-        Get(
-            _SingleLauncherResult,
-            _SingleLauncherDownload(
-                os_name=os_name,
-                arch=arch,
-                url=launcher_subsystem.download_url(os_name, arch),
-                expected_digest=launcher_subsystem.file_digest(os_name, arch),
-            ),
+    # Download platform binaries in parallel, in batches of at most
+    # max_concurrent_downloads so a growing platform list does not fan out
+    # into more concurrent release downloads than the host allows.
+    batch_size = max(1, launcher_subsystem.max_concurrent_downloads)
+    single_results: list[_SingleLauncherResult] = []
+    for start in range(0, len(LAUNCHER_PLATFORMS), batch_size):
+        single_results.extend(
+            await MultiGet(
+                Get(
+                    _SingleLauncherResult,
+                    _SingleLauncherDownload(
+                        os_name=os_name,
+                        arch=arch,
+                        url=launcher_subsystem.download_url(os_name, arch),
+                        expected_digest=launcher_subsystem.file_digest(os_name, arch),
+                    ),
+                )
+                for os_name, arch in LAUNCHER_PLATFORMS[start : start + batch_size]
+            )
         )
-        for os_name, arch in LAUNCHER_PLATFORMS
-    )
 
-    # Merge all platform binaries into a single digest
+    # Merge all platform binaries (already executable) into a single digest
     merged = await Get(
         Digest,
         MergeDigests(r.digest for r in single_results),
     )
 
-    # Re-create with executable permissions
-    contents = await Get(DigestContents, Digest, merged)
-    executable_files = []
-    for fc in contents:
-        executable_files.append(
-            FileContent(
-                path=fc.path,
-                content=fc.content,
-                is_executable=True,
-            )
-        )
-
-    if executable_files:
-        merged = await Get(Digest, CreateDigest(executable_files))
-
     logger.info(
         "Downloaded python-service-launcher %s for %d platforms",
         launcher_subsystem.version,
@@ -167,5 +177,8 @@ async def download_launcher_binaries(
     return LauncherBinariesResult(digest=merged)
 
 
+_RULES = tuple(collect_rules())
+
+
 def rules():
-    return collect_rules()
+    return _RULES
@@ -2,13 +2,22 @@
 
 import logging
 from dataclasses import dataclass
+from functools import cached_property, partial
+from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+
 from pants.engine.addresses import Addresses, UnparsedAddressInputs
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import (
     FieldSet,
+    FilteredTargets,
+    Target,
     Targets,
     WrappedTarget,
     WrappedTargetRequest,
@@ -73,6 +82,35 @@ from pants_sls_distribution.targets import (
 logger = logging.getLogger(__name__)
 
 
+class _ManifestDumper(_SafeDumper):
+    """YAML dumper for manifest.yml that emits FrozenDict and tuple as plain YAML.
+
+    ManifestData.to_dict() passes its FrozenDict and tuple fields through
+    uncopied. Uses libyaml's C emitter when PyYAML was built with it.
+    """
+
+
+def _represent_frozendict(dumper: _ManifestDumper, data: FrozenDict) -> yaml.MappingNode:
+    # Handing represent_mapping a list of pairs keeps insertion order and
+    # skips its sort_keys handling.
+    return dumper.represent_mapping("tag:yaml.org,2002:map", list(data.items()))
+
+
+_ManifestDumper.add_representer(FrozenDict, _represent_frozendict)
+_ManifestDumper.add_representer(tuple, _ManifestDumper.represent_list)
+
+# The one manifest serialization configuration, shared by every target.
+# PyYAML binds a dumper to its output stream, so a dumper is still built
+# per document; only the options and representer table are shared.
+_dump_manifest_yaml = partial(
+    yaml.dump,
+    Dumper=_ManifestDumper,
+    default_flow_style=False,
+    sort_keys=False,
+    allow_unicode=True,
+)
+
+
 # =============================================================================
 # Request / Result types
 # =============================================================================
@@ -113,8 +151,17 @@ class SlsManifestFieldSet(FieldSet):
     artifacts: ArtifactsField
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlsManifestRequest:
+    """Request to generate the manifest for one sls_service field set.
+
+    Equality and hashing derive only from the field set (target address and
+    field values), so the engine memoizes generate_manifest per target and
+    every goal in a run (sls-validate, sls-package, sls-docker, ...) shares
+    one SlsManifest. Keep generate_manifest free of ambient inputs such as
+    timestamps, the working directory or environment variables.
+    """
+
     field_set: SlsManifestFieldSet
 
 
@@ -127,12 +174,35 @@ class SlsManifest:
     product_version: str
     data: ManifestData
 
+    @cached_property
+    def content_bytes(self) -> bytes:
+        """UTF-8 encoded content, encoded once per manifest and shared by all goals."""
+        return self.content.encode("utf-8")
+
+    @cached_property
+    def data_dict(self) -> dict[str, Any]:
+        """``data.to_dict()``, built once per manifest. Treat as read-only."""
+        return self.data.to_dict()
+
+
+@dataclass(frozen=True, slots=True)
+class SlsServiceTargets:
+    """The sls_service targets among the goal's filtered targets."""
+
+    targets: tuple[Target, ...]
+
 
 # =============================================================================
 # Rules
 # =============================================================================
 
 
+@rule(desc="Find sls_service targets")
+async def find_sls_service_targets(targets: FilteredTargets) -> SlsServiceTargets:
+    # Computed once per run and shared by every sls-* goal that requests it.
+    return SlsServiceTargets(tuple(t for t in targets if t.has_field(EntrypointField)))
+
+
 @rule(desc="Generate SLS manifest")
 async def generate_manifest(
     request: SlsManifestRequest,
@@ -148,79 +218,69 @@ async def generate_manifest(
     validate_manifest_identity(product_group, product_name, version)
 
     # Validate check field mutual exclusivity
-    check_count = sum(
-        1
-        for v in [fs.check_args.value, fs.check_command.value, fs.check_script.value]
-        if v is not None
+    check_count = (
+        (fs.check_args.value is not None)
+        + (fs.check_command.value is not None)
+        + (fs.check_script.value is not None)
     )
     if check_count > 1:
         raise ManifestValidationError(
             "Only one of check_args, check_command, or check_script may be set."
         )
 
-    # --- Resolve product dependencies ---
-    product_deps: tuple[ProductDependency, ...] = ()
-    if fs.product_dependencies.value:
-        dep_addresses = await Get(
-            Addresses,
-            UnparsedAddressInputs,
-            fs.product_dependencies.to_unparsed_address_inputs(),
-        )
-        dep_targets_wrapped = await MultiGet(
-            Get(WrappedTarget, WrappedTargetRequest(addr, description_of_origin="sls_service.product_dependencies"))
-            for addr in dep_addresses
-        )
-        deps = []
-        for wrapped in dep_targets_wrapped:
-            t = wrapped.target
-            dep = _resolve_product_dependency(t)
-            validate_dependency(dep)
-            deps.append(dep)
-        product_deps = tuple(deps)
-
-    # --- Resolve product incompatibilities ---
-    product_incompats: tuple[ProductIncompatibility, ...] = ()
-    if fs.product_incompatibilities.value:
-        incompat_addresses = await Get(
-            Addresses,
-            UnparsedAddressInputs,
-            fs.product_incompatibilities.to_unparsed_address_inputs(),
-        )
-        incompat_wrapped = await MultiGet(
-            Get(WrappedTarget, WrappedTargetRequest(addr, description_of_origin="sls_service.product_incompatibilities"))
-            for addr in incompat_addresses
-        )
-        product_incompats = tuple(
-            ProductIncompatibility(
-                product_group=w.target[ProductGroupField].value,
-                product_name=w.target[ProductNameField].value,
-                version_range=w.target[VersionRangeField].value,
-                reason=w.target[ReasonField].value,
-            )
-            for w in incompat_wrapped
-        )
+    # --- Resolve referenced targets ---
+    # Addresses for all three reference fields are resolved in one batch,
+    # then every referenced target is fetched in a second one.
+    reference_fields = {
+        "sls_service.product_dependencies": fs.product_dependencies,
+        "sls_service.product_incompatibilities": fs.product_incompatibilities,
+        "sls_service.artifacts": fs.artifacts,
+    }
+    requested = [(origin, field) for origin, field in reference_fields.items() if field.value]
+    addresses_per_field = await MultiGet(
+        Get(Addresses, UnparsedAddressInputs, field.to_unparsed_address_inputs())
+        for _, field in requested
+    )
+    origin_addresses = [
+        (origin, addr)
+        for (origin, _), addresses in zip(requested, addresses_per_field)
+        for addr in addresses
+    ]
+    wrapped_targets = await MultiGet(
+        Get(WrappedTarget, WrappedTargetRequest(addr, description_of_origin=origin))
+        for origin, addr in origin_addresses
+    )
+    targets_by_origin: dict[str, list[Target]] = {origin: [] for origin in reference_fields}
+    for (origin, _), wrapped in zip(origin_addresses, wrapped_targets):
+        targets_by_origin[origin].append(wrapped.target)
+
+    # --- Product dependencies ---
+    product_deps: tuple[ProductDependency, ...] = tuple(
+        _validated_product_dependency(t)
+        for t in targets_by_origin["sls_service.product_dependencies"]
+    )
 
-    # --- Resolve artifacts ---
-    artifacts: tuple[Artifact, ...] = ()
-    if fs.artifacts.value:
-        art_addresses = await Get(
-            Addresses,
-            UnparsedAddressInputs,
-            fs.artifacts.to_unparsed_address_inputs(),
+    # --- Product incompatibilities ---
+    product_incompats: tuple[ProductIncompatibility, ...] = tuple(
+        ProductIncompatibility(
+            product_group=t[ProductGroupField].value,
+            product_name=t[ProductNameField].value,
+            version_range=t[VersionRangeField].value,
+            reason=t[ReasonField].value,
         )
-        art_wrapped = await MultiGet(
-            Get(WrappedTarget, WrappedTargetRequest(addr, description_of_origin="sls_service.artifacts"))
-            for addr in art_addresses
-        )
-        artifacts = tuple(
-            Artifact(
-                type=w.target[ArtifactTypeField].value,
-                uri=w.target[ArtifactUriField].value,
-                name=w.target[ArtifactNameField].value,
-                digest=w.target[ArtifactDigestField].value,
-            )
-            for w in art_wrapped
+        for t in targets_by_origin["sls_service.product_incompatibilities"]
+    )
+
+    # --- Artifacts ---
+    artifacts: tuple[Artifact, ...] = tuple(
+        Artifact(
+            type=t[ArtifactTypeField].value,
+            uri=t[ArtifactUriField].value,
+            name=t[ArtifactNameField].value,
+            digest=t[ArtifactDigestField].value,
         )
+        for t in targets_by_origin["sls_service.artifacts"]
+    )
 
     # --- Build replication dict ---
     replication_items: dict[str, int] = {}
@@ -243,24 +303,19 @@ async def generate_manifest(
         product_version=version,
         display_name=fs.display_name.value,
         description=fs.description.value,
-        traits=tuple(fs.traits.value or ()),
-        labels=FrozenDict(fs.labels.value or {}),
-        annotations=FrozenDict(fs.annotations.value or {}),
-        resource_requests=FrozenDict(fs.resource_requests.value or {}),
-        resource_limits=FrozenDict(fs.resource_limits.value or {}),
+        traits=fs.traits.value or (),
+        labels=_frozen_or_empty(fs.labels.value),
+        annotations=_frozen_or_empty(fs.annotations.value),
+        resource_requests=_frozen_or_empty(fs.resource_requests.value),
+        resource_limits=_frozen_or_empty(fs.resource_limits.value),
         replication=FrozenDict(replication_items),
         product_dependencies=product_deps,
         product_incompatibilities=product_incompats,
         artifacts=artifacts,
-        extensions=FrozenDict(fs.manifest_extensions.value or {}),
+        extensions=_frozen_or_empty(fs.manifest_extensions.value),
     )
 
-    content = yaml.dump(
-        manifest_data.to_dict(),
-        default_flow_style=False,
-        sort_keys=False,
-        allow_unicode=True,
-    )
+    content = _dump_manifest_yaml(manifest_data.to_dict())
 
     logger.info(
         "Generated manifest for %s:%s version %s",
@@ -282,10 +337,32 @@ async def generate_manifest(
 # =============================================================================
 
 
+_EMPTY_FROZENDICT: FrozenDict = FrozenDict()
+
+
+def _frozen_or_empty(value) -> FrozenDict:
+    """Return a dict field's value as a FrozenDict, without copying one.
+
+    DictStringToStringField values are already FrozenDicts (or None).
+    """
+    if value is None:
+        return _EMPTY_FROZENDICT
+    if isinstance(value, FrozenDict):
+        return value
+    return FrozenDict(value)
+
+
+def _validated_product_dependency(target) -> ProductDependency:
+    """Resolve and validate the ProductDependency of a dependency target."""
+    dep = _resolve_product_dependency(target)
+    validate_dependency(dep)
+    return dep
+
+
 def _resolve_product_dependency(target) -> ProductDependency:
     """Extract ProductDependency from an sls_product_dependency target."""
-    max_version = target[MaximumVersionField].value
     min_version = target[MinimumVersionField].value
+    max_version = target[MaximumVersionField].value
 
     # Default maximum version: derive <major>.x.x from minimum_version
     if max_version is None and min_version:
@@ -301,5 +378,8 @@ def _resolve_product_dependency(target) -> ProductDependency:
     )
 
 
+_RULES = tuple(collect_rules())
+
+
 def rules():
-    return collect_rules()
+    return _RULES
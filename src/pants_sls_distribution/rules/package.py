@@ -2,22 +2,22 @@
 
 import logging
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Mapping, Optional
 
 from pants.engine.fs import Digest
-from pants.engine.rules import Get, collect_rules, rule
+from pants.engine.rules import Get, MultiGet, collect_rules, rule
 
 from pants_sls_distribution._check_script import CheckMode, generate_check_script
 from pants_sls_distribution._hooks import (
     generate_startup_script,
-    get_entrypoint_script,
-    get_hooks_library,
+    get_entrypoint_script_bytes,
+    get_hooks_library_bytes,
     validate_hook_paths,
 )
-from pants_sls_distribution._init_script import generate_init_script
+from pants_sls_distribution._init_script import generate_init_script_bytes
 from pants_sls_distribution._launcher_config import (
     build_check_launcher_config,
-    build_launcher_config,
+    render_launcher_static_yaml,
 )
 from pants_sls_distribution._layout import SlsLayout, build_layout
 from pants_sls_distribution._lock_file import generate_lock_file
@@ -50,14 +50,14 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlsPackageRequest:
     """Request to assemble an SLS distribution layout."""
 
     field_set: SlsManifestFieldSet
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlsPackageResult:
     """Result of SLS layout assembly."""
 
@@ -68,6 +68,16 @@ class SlsPackageResult:
     dist_name: str
     launcher_digest: Digest
 
+    @property
+    def tarball_name(self) -> str:
+        """File name of the distribution tarball, e.g. ``my-svc-1.0.0.sls.tgz``."""
+        return f"{self.dist_name}.sls.tgz"
+
+    @property
+    def image_tag(self) -> str:
+        """Docker image tag for the distribution, e.g. ``my-svc:1.0.0``."""
+        return f"{self.product_name}:{self.product_version}"
+
 
 # =============================================================================
 # Rules
@@ -80,8 +90,12 @@ async def assemble_sls_package(
 ) -> SlsPackageResult:
     fs = request.field_set
 
-    # Generate the manifest first
-    manifest = await Get(SlsManifest, SlsManifestRequest(fs))
+    # The launcher binaries do not depend on the manifest, so download them
+    # while the manifest is generated.
+    manifest, launcher_result = await MultiGet(
+        Get(SlsManifest, SlsManifestRequest(fs)),
+        Get(LauncherBinariesResult, LauncherBinariesRequest()),
+    )
 
     product_name = manifest.data.product_name
     product_version = manifest.product_version
@@ -91,7 +105,7 @@ async def assemble_sls_package(
     pex_binary = fs.pex_binary.value if hasattr(fs, "pex_binary") else None
     executable = pex_binary or f"service/bin/{product_name}.pex"
 
-    launcher_config = build_launcher_config(
+    launcher_static_yaml = render_launcher_static_yaml(
         service_name=product_name,
         executable=executable,
         entry_point=entrypoint,
@@ -101,7 +115,9 @@ async def assemble_sls_package(
     )
 
     # --- Generate init script ---
-    init_script = generate_init_script(service_name=product_name)
+    # The fixed scripts are carried as pre-encoded bytes, so sls-package
+    # writes them without a per-file encode.
+    init_script = generate_init_script_bytes(service_name=product_name)
 
     # --- Generate check script ---
     check_args = fs.check_args.value
@@ -135,24 +151,21 @@ async def assemble_sls_package(
     hook_entrypoint_content = None
     hook_library_content = None
     hook_startup_content = None
-    hook_scripts: Optional[Dict[str, str]] = None
+    hook_scripts: Optional[Mapping[str, str]] = None
 
     if hooks:
         validate_hook_paths(hooks)
-        hook_entrypoint_content = get_entrypoint_script()
-        hook_library_content = get_hooks_library()
+        hook_entrypoint_content = get_entrypoint_script_bytes()
+        hook_library_content = get_hooks_library_bytes()
         hook_startup_content = generate_startup_script(product_name)
-        hook_scripts = dict(hooks)
-
-    # --- Download launcher binaries ---
-    launcher_result = await Get(LauncherBinariesResult, LauncherBinariesRequest())
+        hook_scripts = hooks
 
     # --- Assemble layout ---
     layout = build_layout(
         product_name=product_name,
         product_version=product_version,
         manifest_yaml=manifest.content,
-        launcher_static_yaml=launcher_config.to_yaml(),
+        launcher_static_yaml=launcher_static_yaml,
         init_script=init_script,
         check_script_content=check_result.check_script_content,
         check_script_source=check_result.source_path,
@@ -178,5 +191,8 @@ async def assemble_sls_package(
     )
 
 
+_RULES = tuple(collect_rules())
+
+
 def rules():
-    return collect_rules()
+    return _RULES
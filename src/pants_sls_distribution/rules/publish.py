@@ -3,6 +3,8 @@
 import logging
 import os
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 
 from pants.engine.rules import Get, collect_rules, rule
 
@@ -27,7 +29,7 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlsPublishRequest:
     """Request to publish an SLS distribution to Apollo Hub."""
 
@@ -35,7 +37,7 @@ class SlsPublishRequest:
     dry_run: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlsPublishResult:
     """Result of publishing to Apollo Hub."""
 
@@ -54,8 +56,22 @@ async def publish_sls_distribution(
     request: SlsPublishRequest,
     subsystem: SlsDistributionSubsystem,
 ) -> SlsPublishResult:
+    fs = request.field_set
+    hub_url = subsystem.apollo_hub_url
+
+    # Nothing can be published without a hub; fail before generating the
+    # manifest.
+    if not request.dry_run and not hub_url:
+        return SlsPublishResult(
+            result=PublishResult.failure(
+                "apollo_hub_url not configured. Set [sls-distribution].apollo_hub_url in pants.toml"
+            ),
+            product_id=f"{fs.product_group.value}:{fs.product_name.value}",
+            product_version=fs.version.value,
+        )
+
     # Generate the manifest
-    manifest = await Get(SlsManifest, SlsManifestRequest(request.field_set))
+    manifest = await Get(SlsManifest, SlsManifestRequest(fs))
 
     product_group = manifest.data.product_group
     product_name = manifest.data.product_name
@@ -90,17 +106,8 @@ async def publish_sls_distribution(
         # Resolve auth token: subsystem option > environment variable
         auth_token = subsystem.apollo_auth_token or os.environ.get("APOLLO_AUTH_TOKEN") or None
 
-        hub_url = subsystem.apollo_hub_url
-        if not hub_url:
-            result = PublishResult.failure(
-                "apollo_hub_url not configured. Set [sls-distribution].apollo_hub_url in pants.toml"
-            )
-        else:
-            client = ApolloHubClient(
-                base_url=hub_url,
-                auth_token=auth_token,
-            )
-            result = client.publish_release(publish_request)
+        client = _hub_client(hub_url, auth_token)
+        result = client.publish_release(publish_request)
 
     logger.info(
         "Publish %s: %s v%s -> %s",
@@ -117,5 +124,23 @@ async def publish_sls_distribution(
     )
 
 
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+@lru_cache(maxsize=4)
+def _hub_client(base_url: str, auth_token: Optional[str]) -> ApolloHubClient:
+    """Return a shared ApolloHubClient per (hub URL, token).
+
+    Publishes in the same run (and across runs in pantsd) reuse one client,
+    and with it any connection pooling the client keeps.
+    """
+    return ApolloHubClient(base_url=base_url, auth_token=auth_token)
+
+
+_RULES = tuple(collect_rules())
+
+
 def rules():
-    return collect_rules()
+    return _RULES
@@ -1,16 +1,18 @@
 """Manifest validation rule: validate manifest against JSON schema and semantic rules."""
 
-import json
 import logging
 from dataclasses import dataclass
-from importlib import resources as importlib_resources
-from typing import Any, Optional
+from itertools import chain
 
-from pants.engine.rules import Get, collect_rules, rule
+from pants.engine.rules import Get, MultiGet, collect_rules, rule
 
-from pants_sls_distribution._types import ManifestData
+from pants_sls_distribution._schema import build_schema_validators, validate_against_schema
 from pants_sls_distribution._validation import validate_manifest_data
-from pants_sls_distribution.rules.manifest import SlsManifest, SlsManifestRequest
+from pants_sls_distribution.rules.manifest import (
+    SlsManifest,
+    SlsManifestFieldSet,
+    SlsManifestRequest,
+)
 from pants_sls_distribution.subsystem import SlsDistributionSubsystem
 
 logger = logging.getLogger(__name__)
@@ -21,14 +23,14 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlsValidationRequest:
     """Request to validate a manifest."""
 
     manifest: SlsManifest
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlsValidationResult:
     """Result of manifest validation."""
 
@@ -45,26 +47,32 @@ class SlsValidationResult:
         return cls(valid=False, errors=errors, warnings=warnings)
 
 
-# =============================================================================
-# Schema loading
-# =============================================================================
+@dataclass(frozen=True, slots=True)
+class SlsTargetValidationRequest:
+    """Request to generate and validate the manifest for one field set."""
 
-_SCHEMA_CACHE: Optional[dict[str, Any]] = None
+    field_set: SlsManifestFieldSet
 
 
-def _load_manifest_schema() -> dict[str, Any]:
-    """Load the manifest.v1.json schema from bundled resources."""
-    global _SCHEMA_CACHE
-    if _SCHEMA_CACHE is not None:
-        return _SCHEMA_CACHE
+@dataclass(frozen=True, slots=True)
+class SlsTargetValidation:
+    """A target's generated manifest together with its validation result."""
+
+    manifest: SlsManifest
+    result: SlsValidationResult
 
-    schema_path = (
-        importlib_resources.files("pants_sls_distribution")
-        / "schemas"
-        / "manifest.v1.json"
-    )
-    _SCHEMA_CACHE = json.loads(schema_path.read_text(encoding="utf-8"))
-    return _SCHEMA_CACHE
+
+@dataclass(frozen=True, slots=True)
+class SchemaValidatorRequest:
+    """Request to build the cached schema validators ahead of first use.
+
+    Field-free, so the engine runs the warm-up once per session.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaValidatorReady:
+    """Marker that the schema validators (if enabled) have been built."""
 
 
 # =============================================================================
@@ -80,42 +88,53 @@ async def validate_manifest(
     manifest = request.manifest
     data = manifest.data
 
-    # Use the pure validation function for all semantic checks
-    errors_list, warnings_list = validate_manifest_data(data)
-    errors = list(errors_list)
-    warnings = list(warnings_list)
+    # Use the pure validation function for all semantic checks. Identity
+    # fields were already checked when the manifest was generated.
+    errors, warnings = validate_manifest_data(data, validate_identity=False)
+
+    # A manifest that already fails semantic checks is rejected without the
+    # (much slower) schema pass.
+    if errors:
+        return SlsValidationResult.failure(tuple(errors), warnings=tuple(warnings))
 
     # --- JSON Schema validation (optional, requires jsonschema) ---
     if subsystem.strict_validation:
-        schema_errors, schema_warnings = _validate_against_schema(data)
-        errors.extend(schema_errors)
+        schema_errors, schema_warnings = validate_against_schema(manifest.data_dict)
+        if schema_errors:
+            return SlsValidationResult.failure(
+                tuple(schema_errors), warnings=tuple(chain(warnings, schema_warnings))
+            )
         warnings.extend(schema_warnings)
 
-    if errors:
-        return SlsValidationResult.failure(tuple(errors), warnings=tuple(warnings))
-
     logger.info("Manifest validation passed for %s", manifest.product_id)
     return SlsValidationResult.success(warnings=tuple(warnings))
 
 
-def _validate_against_schema(data: ManifestData) -> tuple[list[str], list[str]]:
-    """Validate manifest dict against the JSON schema. Returns (errors, warnings)."""
-    try:
-        import jsonschema
-    except ImportError:
-        return [], ["jsonschema package not available; skipping schema validation"]
+@rule(desc="Generate and validate SLS manifest")
+async def validate_target_manifest(request: SlsTargetValidationRequest) -> SlsTargetValidation:
+    # Chaining per target lets the engine validate each manifest as soon as
+    # it is generated, rather than after every manifest is done. The schema
+    # validators are built while the first manifest is generated.
+    manifest, _ = await MultiGet(
+        Get(SlsManifest, SlsManifestRequest(request.field_set)),
+        Get(SchemaValidatorReady, SchemaValidatorRequest()),
+    )
+    result = await Get(SlsValidationResult, SlsValidationRequest(manifest))
+    return SlsTargetValidation(manifest=manifest, result=result)
+
+
+@rule(desc="Prepare SLS manifest schema validators")
+async def prepare_schema_validators(
+    request: SchemaValidatorRequest,
+    subsystem: SlsDistributionSubsystem,
+) -> SchemaValidatorReady:
+    if subsystem.strict_validation:
+        build_schema_validators()
+    return SchemaValidatorReady()
 
-    schema = _load_manifest_schema()
-    manifest_dict = data.to_dict()
 
-    validator = jsonschema.Draft7Validator(schema)
-    errors = []
-    for error in validator.iter_errors(manifest_dict):
-        path = ".".join(str(p) for p in error.absolute_path)
-        prefix = f"[{path}] " if path else ""
-        errors.append(f"Schema: {prefix}{error.message}")
-    return errors, []
+_RULES = tuple(collect_rules())
 
 
 def rules():
-    return collect_rules()
+    return _RULES
@@ -8,12 +8,13 @@ binaries bundled together.
 from typing import Optional
 
 from pants.engine.fs import FileDigest
-from pants.option.option_types import StrListOption, StrOption
+from pants.option.option_types import IntOption, StrListOption, StrOption
 from pants.option.subsystem import Subsystem
 
 from pants_sls_distribution._launcher_binary import (
     LAUNCHER_PLATFORMS,
     launcher_asset_name,
+    parse_known_versions,
 )
 
 
@@ -46,6 +47,14 @@ class PythonServiceLauncherSubsystem(Subsystem):
         ),
     )
 
+    max_concurrent_downloads = IntOption(
+        default=6,
+        help=(
+            "Maximum number of platform binaries to download at once. "
+            "Downloads beyond this are issued in later batches."
+        ),
+    )
+
     def download_url(self, os_name: str, arch: str) -> str:
         """Build the GitHub release download URL for a platform binary."""
         asset = launcher_asset_name(os_name, arch)
@@ -59,13 +68,10 @@ class PythonServiceLauncherSubsystem(Subsystem):
 
         Returns None if no matching entry is found (e.g. placeholder hashes).
         """
-        for entry in self.known_versions:
-            parts = entry.split("|")
-            if len(parts) != 5:
-                continue
-            ver, entry_os, entry_arch, sha256, size_str = parts
-            if ver == self.version and entry_os == os_name and entry_arch == arch:
-                if sha256.startswith("<"):
-                    return None
-                return FileDigest(fingerprint=sha256, serialized_bytes_length=int(size_str))
-        return None
+        pinned = parse_known_versions(tuple(self.known_versions)).get(
+            (self.version, os_name, arch)
+        )
+        if pinned is None:
+            return None
+        sha256, size_str = pinned
+        return FileDigest(fingerprint=sha256, serialized_bytes_length=int(size_str))
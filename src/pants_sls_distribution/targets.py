@@ -7,11 +7,16 @@ Provides:
   - sls_artifact: Artifact reference (OCI image, etc.)
 """
 
+from typing import Optional
+
+from pants.engine.addresses import Address
 from pants.engine.target import (
     COMMON_TARGET_FIELDS,
     BoolField,
     DictStringToStringField,
     IntField,
+    InvalidFieldException,
+    InvalidTargetException,
     MultipleSourcesField,
     SpecialCasedDependencies,
     StringField,
@@ -20,6 +25,12 @@ from pants.engine.target import (
 )
 from pants.util.strutil import softwrap
 
+from pants_sls_distribution._types import (
+    is_orderable_version,
+    is_valid_product_group,
+    is_valid_product_name,
+)
+
 
 # =============================================================================
 # Core identity fields
@@ -27,6 +38,7 @@ from pants.util.strutil import softwrap
 
 
 class ProductGroupField(StringField):
+    __slots__ = ()
     alias = "product_group"
     required = True
     help = softwrap(
@@ -36,8 +48,19 @@ class ProductGroupField(StringField):
         """
     )
 
+    @classmethod
+    def compute_value(cls, raw_value: Optional[str], address: Address) -> Optional[str]:
+        value = super().compute_value(raw_value, address)
+        if value is not None and not is_valid_product_group(value):
+            raise InvalidFieldException(
+                f"The {cls.alias!r} field in target {address} must be lowercase letters, "
+                f"digits, dots, and hyphens, but was {value!r}."
+            )
+        return value
+
 
 class ProductNameField(StringField):
+    __slots__ = ()
     alias = "product_name"
     required = True
     help = softwrap(
@@ -47,8 +70,20 @@ class ProductNameField(StringField):
         """
     )
 
+    @classmethod
+    def compute_value(cls, raw_value: Optional[str], address: Address) -> Optional[str]:
+        value = super().compute_value(raw_value, address)
+        if value is not None and not is_valid_product_name(value):
+            raise InvalidFieldException(
+                f"The {cls.alias!r} field in target {address} must start with a lowercase "
+                f"letter and contain only lowercase letters, digits, dots, and hyphens, "
+                f"but was {value!r}."
+            )
+        return value
+
 
 class VersionField(StringField):
+    __slots__ = ()
     alias = "version"
     required = True
     help = softwrap(
@@ -58,20 +93,34 @@ class VersionField(StringField):
         """
     )
 
+    @classmethod
+    def compute_value(cls, raw_value: Optional[str], address: Address) -> Optional[str]:
+        value = super().compute_value(raw_value, address)
+        if value is not None and not is_orderable_version(value):
+            raise InvalidFieldException(
+                f"The {cls.alias!r} field in target {address} must be an SLS orderable "
+                f"version (X.Y.Z, X.Y.Z-rcN, X.Y.Z-N-gHASH, or X.Y.Z-rcN-N-gHASH), "
+                f"but was {value!r}."
+            )
+        return value
+
 
 class DisplayNameField(StringField):
+    __slots__ = ()
     alias = "display_name"
     default = None
     help = "Human-readable display name for the product."
 
 
 class DescriptionField(StringField):
+    __slots__ = ()
     alias = "description"
     default = None
     help = "Product description."
 
 
 class ProductTypeField(StringField):
+    __slots__ = ()
     alias = "product_type"
     default = "helm.v1"
     help = softwrap(
@@ -88,6 +137,7 @@ class ProductTypeField(StringField):
 
 
 class EntrypointField(StringField):
+    __slots__ = ()
     alias = "entrypoint"
     required = True
     help = softwrap(
@@ -99,29 +149,34 @@ class EntrypointField(StringField):
 
 
 class CommandField(StringField):
+    __slots__ = ()
     alias = "command"
     default = "uvicorn"
     help = "Command to run the service. Default: uvicorn."
 
 
 class ServiceArgsField(StringSequenceField):
+    __slots__ = ()
     alias = "args"
     default = ("--host", "0.0.0.0", "--port", "8080")
     help = "Arguments passed to the service command."
 
 
 class PythonVersionField(StringField):
+    __slots__ = ()
     alias = "python_version"
     default = "3.11"
     help = "Python version requirement for the service."
 
 
 class EnvField(DictStringToStringField):
+    __slots__ = ()
     alias = "env"
     help = "Environment variables set when launching the service."
 
 
 class PexBinaryField(StringField):
+    __slots__ = ()
     alias = "pex_binary"
     default = None
     help = softwrap(
@@ -134,6 +189,7 @@ class PexBinaryField(StringField):
 
 
 class HooksField(DictStringToStringField):
+    __slots__ = ()
     alias = "hooks"
     help = softwrap(
         """
@@ -151,6 +207,7 @@ class HooksField(DictStringToStringField):
 
 
 class CheckArgsField(StringSequenceField):
+    __slots__ = ()
     alias = "check_args"
     default = None
     help = softwrap(
@@ -163,6 +220,7 @@ class CheckArgsField(StringSequenceField):
 
 
 class CheckCommandField(StringField):
+    __slots__ = ()
     alias = "check_command"
     default = None
     help = softwrap(
@@ -175,6 +233,7 @@ class CheckCommandField(StringField):
 
 
 class CheckScriptField(StringField):
+    __slots__ = ()
     alias = "check_script"
     default = None
     help = softwrap(
@@ -192,28 +251,33 @@ class CheckScriptField(StringField):
 
 
 class ResourceRequestsField(DictStringToStringField):
+    __slots__ = ()
     alias = "resource_requests"
     help = "Kubernetes resource requests (e.g., {'cpu': '100m', 'memory': '128Mi'})."
 
 
 class ResourceLimitsField(DictStringToStringField):
+    __slots__ = ()
     alias = "resource_limits"
     help = "Kubernetes resource limits (e.g., {'cpu': '500m', 'memory': '512Mi'})."
 
 
 class ReplicationDesiredField(IntField):
+    __slots__ = ()
     alias = "replication_desired"
     default = None
     help = "Desired replica count."
 
 
 class ReplicationMinField(IntField):
+    __slots__ = ()
     alias = "replication_min"
     default = None
     help = "Minimum replica count."
 
 
 class ReplicationMaxField(IntField):
+    __slots__ = ()
     alias = "replication_max"
     default = None
     help = "Maximum replica count."
@@ -225,22 +289,26 @@ class ReplicationMaxField(IntField):
 
 
 class LabelsField(DictStringToStringField):
+    __slots__ = ()
     alias = "labels"
     help = "Labels applied to the product (e.g., {'team': 'platform'})."
 
 
 class AnnotationsField(DictStringToStringField):
+    __slots__ = ()
     alias = "annotations"
     help = "Annotations applied to the product."
 
 
 class TraitsField(StringSequenceField):
+    __slots__ = ()
     alias = "traits"
     default = ()
     help = "Capability traits (e.g., ['api', 'web'])."
 
 
 class ManifestExtensionsField(DictStringToStringField):
+    __slots__ = ()
     alias = "manifest_extensions"
     help = "Additional manifest extension fields."
 
@@ -251,16 +319,19 @@ class ManifestExtensionsField(DictStringToStringField):
 
 
 class ProductDependenciesField(SpecialCasedDependencies):
+    __slots__ = ()
     alias = "product_dependencies"
     help = "References to sls_product_dependency targets."
 
 
 class ProductIncompatibilitiesField(SpecialCasedDependencies):
+    __slots__ = ()
     alias = "product_incompatibilities"
     help = "References to sls_product_incompatibility targets."
 
 
 class ArtifactsField(SpecialCasedDependencies):
+    __slots__ = ()
     alias = "artifacts"
     help = "References to sls_artifact targets."
 
@@ -271,6 +342,7 @@ class ArtifactsField(SpecialCasedDependencies):
 
 
 class SlsServiceSourcesField(MultipleSourcesField):
+    __slots__ = ()
     default = ("**/*.py",)
     expected_file_extensions = (".py", ".pyi")
     help = "Python source files for the service."
@@ -282,12 +354,14 @@ class SlsServiceSourcesField(MultipleSourcesField):
 
 
 class MinimumVersionField(StringField):
+    __slots__ = ()
     alias = "minimum_version"
     required = True
     help = "Minimum compatible version of the dependency."
 
 
 class MaximumVersionField(StringField):
+    __slots__ = ()
     alias = "maximum_version"
     default = None
     help = softwrap(
@@ -299,12 +373,14 @@ class MaximumVersionField(StringField):
 
 
 class RecommendedVersionField(StringField):
+    __slots__ = ()
     alias = "recommended_version"
     default = None
     help = "Recommended version of the dependency."
 
 
 class OptionalField(BoolField):
+    __slots__ = ()
     alias = "optional"
     default = False
     help = "Whether this dependency is optional."
@@ -316,12 +392,14 @@ class OptionalField(BoolField):
 
 
 class VersionRangeField(StringField):
+    __slots__ = ()
     alias = "version_range"
     required = True
     help = "Version range that is incompatible (e.g., '< 2.0.0')."
 
 
 class ReasonField(StringField):
+    __slots__ = ()
     alias = "reason"
     required = True
     help = "Explanation for the incompatibility."
@@ -333,24 +411,28 @@ class ReasonField(StringField):
 
 
 class ArtifactTypeField(StringField):
+    __slots__ = ()
     alias = "type"
     default = "oci"
     help = "Artifact type (e.g., 'oci' for Docker images)."
 
 
 class ArtifactUriField(StringField):
+    __slots__ = ()
     alias = "uri"
     required = True
     help = "Artifact URI (e.g., 'registry.example.io/my-service:1.0.0')."
 
 
 class ArtifactNameField(StringField):
+    __slots__ = ()
     alias = "artifact_name"
     default = None
     help = "Artifact name."
 
 
 class ArtifactDigestField(StringField):
+    __slots__ = ()
     alias = "digest"
     default = None
     help = "Artifact digest (e.g., 'sha256:abc123...')."
@@ -424,6 +506,19 @@ class SlsServiceTarget(Target):
         SlsServiceSourcesField,
     )
 
+    def validate(self) -> None:
+        check_count = (
+            (self[CheckArgsField].value is not None)
+            + (self[CheckCommandField].value is not None)
+            + (self[CheckScriptField].value is not None)
+        )
+        if check_count > 1:
+            raise InvalidTargetException(
+                f"The {self.alias!r} target {self.address} may set only one of "
+                f"{CheckArgsField.alias!r}, {CheckCommandField.alias!r}, or "
+                f"{CheckScriptField.alias!r}."
+            )
+
 
 class SlsProductDependencyTarget(Target):
     alias = "sls_product_dependency"
@@ -512,6 +607,7 @@ class SlsArtifactTarget(Target):
 
 
 class AssetsField(DictStringToStringField):
+    __slots__ = ()
     alias = "assets"
     help = softwrap(
         """
@@ -525,6 +621,7 @@ class AssetsField(DictStringToStringField):
 
 
 class SlsAssetSourcesField(MultipleSourcesField):
+    __slots__ = ()
     default = ("**/*",)
     help = "Files to include in the asset distribution."
 
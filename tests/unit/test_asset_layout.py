@@ -17,6 +17,10 @@ class TestAssetMapping:
         assert m.source_path == "/src/file.txt"
         assert m.dest_path == "data/file.txt"
 
+    def test_uses_slots(self):
+        m = AssetMapping(source_path="/src/file.txt", dest_path="data/file.txt")
+        assert not hasattr(m, "__dict__")
+
 
 class TestBuildAssetLayout:
     """Test asset distribution layout assembly."""
@@ -7,6 +7,7 @@ import pytest
 from pants_sls_distribution._check_script import (
     CheckMode,
     CheckScriptResult,
+    _generate_check_script,
     generate_check_script,
 )
 
@@ -165,3 +166,19 @@ class TestMutualExclusivity:
                 check_command="curl localhost",
                 check_script_path="check.sh",
             )
+
+
+class TestGenerateCheckScriptCaching:
+    """Test memoization of generated check scripts."""
+
+    def test_repeated_calls_share_result(self):
+        _generate_check_script.cache_clear()
+        first = generate_check_script(service_name="my-svc", check_command="curl localhost")
+        second = generate_check_script(service_name="my-svc", check_command="curl localhost")
+        assert second is first
+        assert _generate_check_script.cache_info().hits == 1
+
+    def test_list_check_args_accepted(self):
+        """check_args is normalized to a tuple so list input is hashable."""
+        result = generate_check_script(service_name="my-svc", check_args=["--check"])
+        assert result.mode == CheckMode.CHECK_ARGS
@@ -0,0 +1,145 @@
+"""Tests for the distribution writer (pure functions, no Pants engine)."""
+
+from __future__ import annotations
+
+import os
+import stat
+import tarfile
+from typing import NamedTuple
+
+import pytest
+
+from pants_sls_distribution._distribution import duplicate_dist_names, write_distribution
+from pants_sls_distribution._layout import SlsLayout
+
+
+class _FileContent(NamedTuple):
+    path: str
+    content: bytes
+
+
+def _members(tarball_path):
+    with tarfile.open(tarball_path) as tar:
+        return {
+            m.name: (m, tar.extractfile(m).read() if m.isfile() else None)
+            for m in tar.getmembers()
+        }
+
+
+class TestWriteDistribution:
+    def test_writes_tree_and_tarball(self, tmp_path):
+        layout = SlsLayout(dist_name="my-svc-1.0.0")
+        layout.add_file("deployment/manifest.yml", content="manifest")
+        layout.add_file("service/bin/init.sh", content=b"#!/bin/sh\n", executable=True)
+        launcher = _FileContent("service/bin/linux-amd64/launcher", b"\x7fELF")
+
+        tarball_path = write_distribution(layout, [launcher], tmp_path)
+
+        assert tarball_path == tmp_path / "my-svc-1.0.0.sls.tgz"
+        root = tmp_path / "my-svc-1.0.0"
+        assert (root / "deployment/manifest.yml").read_text() == "manifest"
+        assert os.access(root / "service/bin/init.sh", os.X_OK)
+        members = _members(tarball_path)
+        assert members["my-svc-1.0.0/deployment/manifest.yml"][1] == b"manifest"
+        assert members["my-svc-1.0.0/service/bin/init.sh"][0].mode == 0o755
+        assert members["my-svc-1.0.0/service/bin/linux-amd64/launcher"][1] == b"\x7fELF"
+        assert members["my-svc-1.0.0/service/bin/linux-amd64"][0].isdir()
+
+    def test_symlinked_source_archived_as_regular_file(self, tmp_path):
+        real = tmp_path / "real.sh"
+        real.write_bytes(b"#!/bin/sh\necho check\n")
+        real.chmod(0o755)
+        link = tmp_path / "link.sh"
+        link.symlink_to(real)
+        dist_dir = tmp_path / "dist"
+        dist_dir.mkdir()
+        layout = SlsLayout(dist_name="my-svc-1.0.0")
+        layout.add_file("service/monitoring/bin/check.sh", source_path=str(link), executable=True)
+
+        tarball_path = write_distribution(layout, [], dist_dir)
+
+        member, data = _members(tarball_path)["my-svc-1.0.0/service/monitoring/bin/check.sh"]
+        assert member.isreg()
+        assert data == b"#!/bin/sh\necho check\n"
+        assert member.mode & 0o111 == 0o111
+
+    def test_sources_copied_by_default(self, tmp_path):
+        source = tmp_path / "check.sh"
+        source.write_text("#!/bin/sh\n")
+        dist_dir = tmp_path / "dist"
+        dist_dir.mkdir()
+        layout = SlsLayout(dist_name="my-svc-1.0.0")
+        layout.add_file("service/monitoring/bin/check.sh", source_path=str(source), executable=True)
+
+        write_distribution(layout, [], dist_dir)
+
+        written = dist_dir / "my-svc-1.0.0/service/monitoring/bin/check.sh"
+        assert not os.path.samefile(written, source)
+        assert os.access(written, os.X_OK)
+        assert not os.access(source, os.X_OK)
+
+    def test_hardlink_sources(self, tmp_path):
+        source = tmp_path / "manifest.yml"
+        source.write_text("m")
+        dist_dir = tmp_path / "dist"
+        dist_dir.mkdir()
+        layout = SlsLayout(dist_name="my-svc-1.0.0")
+        layout.add_file("deployment/extra.yml", source_path=str(source))
+
+        write_distribution(layout, [], dist_dir, hardlink_sources=True)
+
+        assert os.path.samefile(dist_dir / "my-svc-1.0.0/deployment/extra.yml", source)
+
+    @pytest.mark.parametrize("umask", [0o002, 0o022, 0o077])
+    def test_tree_modes_match_tarball(self, tmp_path, umask):
+        source = tmp_path / "check.sh"
+        source.write_text("#!/bin/sh\n")
+        source.chmod(0o640)
+        dist_dir = tmp_path / "dist"
+        dist_dir.mkdir()
+        layout = SlsLayout(dist_name="my-svc-1.0.0")
+        layout.add_directory("var/log")
+        layout.add_file("deployment/manifest.yml", content="manifest")
+        layout.add_file("service/bin/init.sh", content="#!/bin/sh\n", executable=True)
+        layout.add_file("service/monitoring/bin/check.sh", source_path=str(source), executable=True)
+        launcher = _FileContent("service/bin/linux-amd64/launcher", b"\x7fELF")
+
+        previous_umask = os.umask(umask)
+        try:
+            tarball_path = write_distribution(layout, [launcher], dist_dir)
+        finally:
+            os.umask(previous_umask)
+
+        for name, (member, _) in _members(tarball_path).items():
+            on_disk = stat.S_IMODE(os.stat(dist_dir / name).st_mode)
+            assert member.mode == on_disk, name
+        assert _members(tarball_path)["my-svc-1.0.0/deployment/manifest.yml"][0].mode == 0o644
+
+    def test_replaces_previous_output(self, tmp_path):
+        stale = tmp_path / "my-svc-1.0.0" / "stale.txt"
+        stale.parent.mkdir()
+        stale.write_text("old")
+        layout = SlsLayout(dist_name="my-svc-1.0.0")
+        layout.add_file("deployment/manifest.yml", content="manifest")
+
+        write_distribution(layout, [], tmp_path)
+
+        assert not stale.exists()
+        assert (tmp_path / "my-svc-1.0.0/deployment/manifest.yml").exists()
+
+
+class TestDuplicateDistNames:
+    def test_no_duplicates(self):
+        layouts = [SlsLayout(dist_name="a-1.0.0"), SlsLayout(dist_name="a-2.0.0")]
+        assert duplicate_dist_names(layouts) == []
+
+    def test_duplicates_reported_once(self):
+        layouts = [
+            SlsLayout(dist_name="b-1.0.0"),
+            SlsLayout(dist_name="a-1.0.0"),
+            SlsLayout(dist_name="b-1.0.0"),
+            SlsLayout(dist_name="a-1.0.0"),
+            SlsLayout(dist_name="b-1.0.0"),
+            SlsLayout(dist_name="c-1.0.0"),
+        ]
+        assert duplicate_dist_names(layouts) == ["a-1.0.0", "b-1.0.0"]
@@ -8,7 +8,9 @@ from pants_sls_distribution._hooks import (
     HOOK_PHASES,
     generate_startup_script,
     get_entrypoint_script,
+    get_entrypoint_script_bytes,
     get_hooks_library,
+    get_hooks_library_bytes,
     validate_hook_paths,
 )
 
@@ -83,6 +85,18 @@ class TestValidateHookPaths:
         }
         validate_hook_paths(hooks)
 
+    def test_accepts_iterable_of_keys(self):
+        """Plain iterables of hook paths are validated like dict keys."""
+        validate_hook_paths(("pre-startup.d/10-migrate.sh", "shutdown.d/50-cleanup.sh"))
+        with pytest.raises(ValueError, match="must match"):
+            validate_hook_paths(["pre-startup.d/10-migrate"])
+
+    def test_invalid_format_nested_path(self):
+        """Rejects keys with more than one path separator."""
+        hooks = {"pre-startup.d/sub/10-migrate.sh": "hooks/migrate.sh"}
+        with pytest.raises(ValueError, match="must match"):
+            validate_hook_paths(hooks)
+
 
 class TestGenerateStartupScript:
     """Test generate_startup_script()."""
@@ -143,6 +157,9 @@ class TestGetEntrypointScript:
         content = get_entrypoint_script()
         assert "trap _shutdown TERM INT" in content
 
+    def test_bytes_variant_matches(self):
+        assert get_entrypoint_script_bytes() == get_entrypoint_script().encode("utf-8")
+
 
 class TestGetHooksLibrary:
     """Test get_hooks_library()."""
@@ -166,3 +183,6 @@ class TestGetHooksLibrary:
     def test_provides_run_hooks_warn(self):
         content = get_hooks_library()
         assert "run_hooks_warn()" in content
+
+    def test_bytes_variant_matches(self):
+        assert get_hooks_library_bytes() == get_hooks_library().encode("utf-8")
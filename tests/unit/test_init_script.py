@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from pants_sls_distribution._init_script import generate_init_script
+from pants_sls_distribution._init_script import (
+    generate_init_script,
+    generate_init_script_bytes,
+)
 
 
 class TestGenerateInitScript:
@@ -74,3 +77,16 @@ class TestGenerateInitScript:
     def test_console_mode_uses_exec(self):
         script = generate_init_script(service_name="test-svc")
         assert 'exec "$LAUNCHER"' in script
+
+    def test_memoized(self):
+        generate_init_script.cache_clear()
+        first = generate_init_script(service_name="cached-svc")
+        assert generate_init_script(service_name="cached-svc") is first
+        assert generate_init_script.cache_info().hits == 1
+        assert generate_init_script(service_name="cached-svc", shutdown_timeout=5) != first
+
+    def test_bytes_variant_matches(self):
+        script = generate_init_script(service_name="my-service", shutdown_timeout=12)
+        assert generate_init_script_bytes(
+            service_name="my-service", shutdown_timeout=12
+        ) == script.encode("utf-8")
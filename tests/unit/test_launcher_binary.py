@@ -7,6 +7,7 @@ from pants_sls_distribution._launcher_binary import (
     LAUNCHER_PLATFORMS,
     launcher_asset_name,
     launcher_layout_path,
+    parse_known_versions,
 )
 
 
@@ -69,6 +70,12 @@ class TestLauncherLayoutPath:
             assert path.endswith("/python-service-launcher")
             assert f"{os_name}-{arch}" in path
 
+    def test_unlisted_platform(self):
+        """Platforms outside LAUNCHER_PLATFORMS still get a path."""
+        assert launcher_layout_path("freebsd", "amd64") == (
+            "service/bin/freebsd-amd64/python-service-launcher"
+        )
+
 
 class TestLauncherAssetName:
     """Test launcher_asset_name() helper."""
@@ -98,3 +105,37 @@ class TestLauncherAssetName:
             name = launcher_asset_name(os_name, arch)
             assert name.startswith("python-service-launcher-")
             assert f"{os_name}-{arch}" in name
+
+    def test_unlisted_platform(self):
+        """Platforms outside LAUNCHER_PLATFORMS still get an asset name."""
+        assert launcher_asset_name("freebsd", "amd64") == (
+            "python-service-launcher-freebsd-amd64"
+        )
+
+
+class TestParseKnownVersions:
+    """Test parse_known_versions() helper."""
+
+    def test_indexes_by_version_and_platform(self):
+        table = parse_known_versions((
+            "v0.1.0|linux|amd64|abc123|42",
+            "v0.1.0|darwin|arm64|def456|7",
+        ))
+        assert table == {
+            ("v0.1.0", "linux", "amd64"): ("abc123", "42"),
+            ("v0.1.0", "darwin", "arm64"): ("def456", "7"),
+        }
+
+    def test_placeholder_hash_maps_to_none(self):
+        table = parse_known_versions(("v0.2.0|linux|amd64|<sha256>|0",))
+        assert table == {("v0.2.0", "linux", "amd64"): None}
+
+    def test_malformed_entries_skipped(self):
+        assert parse_known_versions(("v0.1.0|linux|amd64|abc123",)) == {}
+
+    def test_first_entry_wins(self):
+        table = parse_known_versions((
+            "v0.1.0|linux|amd64|first|1",
+            "v0.1.0|linux|amd64|second|2",
+        ))
+        assert table[("v0.1.0", "linux", "amd64")] == ("first", "1")
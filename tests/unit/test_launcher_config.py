@@ -10,6 +10,7 @@ from pants_sls_distribution._launcher_config import (
     LauncherConfig,
     build_check_launcher_config,
     build_launcher_config,
+    render_launcher_static_yaml,
 )
 
 
@@ -122,6 +123,10 @@ class TestLauncherConfig:
         with pytest.raises(AttributeError):
             config.executable = "other.pex"  # type: ignore[misc]
 
+    def test_uses_slots(self):
+        config = LauncherConfig(executable="app.pex")
+        assert not hasattr(config, "__dict__")
+
 
 class TestCheckLauncherConfig:
     """Test CheckLauncherConfig for health check mode."""
@@ -200,6 +205,36 @@ class TestBuildLauncherConfig:
         assert len(config.env) == 2  # Just the two defaults
 
 
+class TestRenderLauncherStaticYaml:
+    """Test the memoized launcher-static.yml renderer."""
+
+    def test_matches_built_config(self):
+        kwargs = dict(
+            service_name="my-service",
+            executable="service/bin/my-service.pex",
+            entry_point="app:main",
+            args=("--port", "9090"),
+            env={"CUSTOM_VAR": "value"},
+        )
+        assert render_launcher_static_yaml(**kwargs) == build_launcher_config(**kwargs).to_yaml()
+
+    def test_memoized(self):
+        first = render_launcher_static_yaml(service_name="svc", executable="app.pex", env={"A": "1"})
+        second = render_launcher_static_yaml(service_name="svc", executable="app.pex", env={"A": "1"})
+        assert first is second
+
+    def test_env_order_preserved(self):
+        content = render_launcher_static_yaml(
+            service_name="svc", executable="app.pex", env={"B": "2", "A": "1"}
+        )
+        assert list(yaml.safe_load(content)["env"]) == [
+            "PYTHONDONTWRITEBYTECODE",
+            "PYTHONUNBUFFERED",
+            "B",
+            "A",
+        ]
+
+
 class TestBuildCheckLauncherConfig:
     """Test the check launcher factory."""
 
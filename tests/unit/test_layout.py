@@ -28,6 +28,30 @@ class TestSlsLayout:
         assert layout.files[0].source_path == "/path/to/check.sh"
         assert layout.files[0].executable is True
 
+    def test_add_files(self):
+        layout = SlsLayout(dist_name="my-svc-1.0.0")
+        layout.add_file("deployment/manifest.yml", content="manifest")
+        layout.add_files(
+            [
+                ("asset/a.txt", "/src/a.txt", None),
+                ("asset/b.txt", None, "inline"),
+            ]
+        )
+        assert [f.relative_path for f in layout.files] == [
+            "deployment/manifest.yml",
+            "asset/a.txt",
+            "asset/b.txt",
+        ]
+        assert layout.files[1].source_path == "/src/a.txt"
+        assert layout.files[1].content is None
+        assert layout.files[2].content == "inline"
+        assert not any(f.executable for f in layout.files)
+
+    def test_add_files_executable(self):
+        layout = SlsLayout(dist_name="my-svc-1.0.0")
+        layout.add_files([("hooks/a.sh", "/src/a.sh", None)], executable=True)
+        assert layout.files[0].executable is True
+
     def test_add_directory(self):
         layout = SlsLayout(dist_name="my-svc-1.0.0")
         layout.add_directory("var/log")
@@ -88,6 +112,17 @@ class TestBuildLayout:
         assert "service/bin/init.sh" in files
         assert files["service/bin/init.sh"].executable is True
 
+    def test_init_script_bytes_carried_through(self):
+        layout = build_layout(
+            product_name="my-svc",
+            product_version="1.0.0",
+            manifest_yaml="m",
+            launcher_static_yaml="l",
+            init_script=b"#!/bin/bash\necho hello",
+        )
+        files = {f.relative_path: f for f in layout.files}
+        assert files["service/bin/init.sh"].content == b"#!/bin/bash\necho hello"
+
     def test_runtime_directories(self):
         layout = build_layout(
             product_name="my-svc",
@@ -128,6 +163,21 @@ class TestBuildLayout:
         assert "service/monitoring/bin/check.sh" in files
         assert files["service/monitoring/bin/check.sh"].source_path == "/path/to/check.sh"
 
+    def test_check_script_content_wins_over_source(self):
+        layout = build_layout(
+            product_name="my-svc",
+            product_version="1.0.0",
+            manifest_yaml="m",
+            launcher_static_yaml="l",
+            init_script="i",
+            check_script_content="generated",
+            check_script_source="/path/to/check.sh",
+        )
+        checks = [f for f in layout.files if f.relative_path == "service/monitoring/bin/check.sh"]
+        assert len(checks) == 1
+        assert checks[0].content == "generated"
+        assert checks[0].source_path is None
+
     def test_with_launcher_check_yaml(self):
         layout = build_layout(
             product_name="my-svc",
@@ -38,6 +38,10 @@ class TestLockEntry:
         with pytest.raises(AttributeError):
             entry.product_group = "other"  # type: ignore[misc]
 
+    def test_uses_slots(self):
+        entry = LockEntry("com.example", "svc", "1.0.0", "1.x.x")
+        assert not hasattr(entry, "__dict__")
+
 
 # =============================================================================
 # generate_lock_file
@@ -190,6 +194,17 @@ class TestParseLockFile:
         entries = parse_lock_file(content)
         assert len(entries) == 1
 
+    def test_surrounding_whitespace_tolerated(self):
+        content = (
+            "   # indented comment\n"
+            "\t \n"
+            "  com.example:svc (1.0.0, 1.x.x) optional  \r\n"
+        )
+        entries = parse_lock_file(content)
+        assert len(entries) == 1
+        assert entries[0].optional is True
+        assert entries[0].maximum_version == "1.x.x"
+
     def test_invalid_line_raises(self):
         content = "this is not valid\n"
         with pytest.raises(ValueError, match="Invalid lock file line"):
@@ -272,6 +287,29 @@ class TestValidateLockFile:
         assert len(errors) == 1
         assert "Duplicate" in errors[0]
 
+    def test_non_adjacent_duplicates_reported_once_each(self):
+        content = (
+            "com.example:svc (1.0.0, 1.x.x)\n"
+            "com.example:other (1.0.0, 1.x.x)\n"
+            "com.example:svc (2.0.0, 2.x.x)\n"
+            "com.example:svc (3.0.0, 3.x.x)\n"
+        )
+        errors = validate_lock_file(content)
+        assert errors == ["Duplicate dependency in lock file: com.example:svc"] * 2
+
+    def test_errors_reported_in_file_order(self):
+        content = (
+            "com.example:zeta (1.0.0, 1.x.x)\n"
+            "com.example:alpha (1.0.0, 1.x.x)\n"
+            "com.example:zeta (2.0.0, 2.x.x)\n"
+            "com.example:alpha (2.0.0, 2.x.x)\n"
+        )
+        errors = validate_lock_file(content)
+        assert errors == [
+            "Duplicate dependency in lock file: com.example:zeta",
+            "Duplicate dependency in lock file: com.example:alpha",
+        ]
+
     def test_invalid_format(self):
         content = "not a valid line\n"
         errors = validate_lock_file(content)
@@ -0,0 +1,111 @@
+"""Tests for manifest JSON schema validation (pure functions, no Pants engine)."""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+
+import pytest
+
+from pants_sls_distribution._schema import (
+    _compiled_manifest_schema,
+    _manifest_schema_validator,
+    _to_json_types,
+    validate_against_schema,
+)
+
+_VALID_MANIFESTS = [
+    {
+        "manifest-version": "1.0",
+        "product-type": "helm.v1",
+        "product-group": "com.example",
+        "product-name": "my-service",
+        "product-version": "1.0.0",
+    },
+    {
+        "manifest-version": "1.0",
+        "product-type": "helm.v1",
+        "product-group": "com.example",
+        "product-name": "my-service",
+        "product-version": "1.0.0",
+        "labels": MappingProxyType({"team": "platform"}),
+        "extensions": {
+            "product-dependencies": (
+                MappingProxyType({
+                    "product-group": "com.example",
+                    "product-name": "database",
+                    "minimum-version": "1.0.0",
+                    "maximum-version": "1.x.x",
+                    "optional": False,
+                }),
+            ),
+        },
+    },
+]
+
+_INVALID_MANIFESTS = [
+    # Missing required fields
+    {"manifest-version": "1.0", "product-type": "helm.v1"},
+    # Label values must be strings
+    {
+        "product-type": "helm.v1",
+        "product-group": "com.example",
+        "product-name": "my-service",
+        "product-version": "1.0.0",
+        "labels": MappingProxyType({"team": 1}),
+    },
+]
+
+
+class TestToJsonTypes:
+    def test_plain_values_not_copied(self):
+        value = {"a": [1, {"b": (2, 3)}], "c": "d"}
+        assert _to_json_types(value) is value
+
+    def test_mapping_nested_in_tuple(self):
+        inner = {"x": 1}
+        value = {"items": (MappingProxyType({"y": 2}), inner), "plain": [1]}
+        converted = _to_json_types(value)
+        assert converted == {"items": [{"y": 2}, {"x": 1}], "plain": [1]}
+        assert type(converted["items"][0]) is dict
+        assert converted["items"][1] is inner
+        assert converted["plain"] is value["plain"]
+        assert value["items"][0] == MappingProxyType({"y": 2})
+
+    def test_frozendict(self):
+        frozendict = pytest.importorskip("pants.util.frozendict")
+        value = ({"a": frozendict.FrozenDict({"b": 1})},)
+        assert _to_json_types(value) == [{"a": {"b": 1}}]
+
+
+class TestValidateAgainstSchema:
+    @pytest.mark.parametrize("manifest", _VALID_MANIFESTS)
+    def test_valid(self, manifest):
+        assert validate_against_schema(manifest) == ([], [])
+
+    @pytest.mark.parametrize("manifest", _INVALID_MANIFESTS)
+    def test_invalid_reports_errors(self, manifest):
+        errors, _ = validate_against_schema(manifest)
+        assert errors
+        assert all(e.startswith("Schema: ") for e in errors)
+
+    def test_all_missing_fields_reported(self):
+        errors, _ = validate_against_schema(_INVALID_MANIFESTS[0])
+        assert len(errors) == 3
+
+    @pytest.mark.parametrize("manifest", _VALID_MANIFESTS + _INVALID_MANIFESTS)
+    def test_fast_path_agrees_with_jsonschema(self, manifest):
+        fastjsonschema = pytest.importorskip("fastjsonschema")
+        compiled = _compiled_manifest_schema()
+        try:
+            compiled(_to_json_types(manifest))
+        except fastjsonschema.JsonSchemaException:
+            fast_valid = False
+        else:
+            fast_valid = True
+        assert fast_valid == _manifest_schema_validator().is_valid(manifest)
+
+    def test_fast_path_does_not_fill_defaults(self):
+        pytest.importorskip("fastjsonschema")
+        manifest = dict(_VALID_MANIFESTS[0])
+        validate_against_schema(manifest)
+        assert manifest == _VALID_MANIFESTS[0]
@@ -0,0 +1,54 @@
+"""Tests for shell template compilation (pure functions, no Pants engine)."""
+
+from __future__ import annotations
+
+import pytest
+
+from pants_sls_distribution._template import compile_bytes_template, compile_template
+
+
+class TestCompileTemplate:
+    """Test compile_template()."""
+
+    def test_matches_str_format(self):
+        raw = "a {x} {{b}} ${{y}} {y}{x} end"
+        render = compile_template(raw, ("x", "y"))
+        assert render(x=1, y="Y") == raw.format(x=1, y="Y")
+
+    def test_no_placeholders(self):
+        render = compile_template("plain {{braces}}\n", ())
+        assert render() == "plain {braces}\n"
+
+    def test_leading_placeholder(self):
+        render = compile_template("{name}-suffix", ("name",))
+        assert render(name="svc") == "svc-suffix"
+
+    def test_values_converted_with_str(self):
+        render = compile_template("timeout={t}", ("t",))
+        assert render(t=30) == "timeout=30"
+
+    def test_unknown_placeholder(self):
+        with pytest.raises(ValueError, match="Unknown template placeholder"):
+            compile_template("{other}", ("name",))
+
+    def test_positional_placeholder(self):
+        with pytest.raises(ValueError, match="Unknown template placeholder"):
+            compile_template("{}", ("name",))
+
+    def test_format_spec_rejected(self):
+        with pytest.raises(ValueError, match="format spec"):
+            compile_template("{name:>10}", ("name",))
+
+    def test_missing_value(self):
+        render = compile_template("{name}", ("name",))
+        with pytest.raises(KeyError):
+            render()
+
+
+class TestCompileBytesTemplate:
+    """Test compile_bytes_template()."""
+
+    def test_matches_encoded_str_format(self):
+        raw = "svc={name} timeout={t} ${{x}} — {name}"
+        render = compile_bytes_template(raw, ("name", "t"))
+        assert render(name="my-svc", t=30) == raw.format(name="my-svc", t=30).encode("utf-8")
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import pytest
 
+from pants.util.frozendict import FrozenDict
+
 from pants_sls_distribution._types import (
     Artifact,
     ManifestData,
     ProductDependency,
     ProductIncompatibility,
+    VERSION_MATCHER_PATTERN,
     is_orderable_version,
     is_valid_product_group,
     is_valid_product_name,
@@ -77,12 +80,24 @@ class TestIsOrderableVersion:
             "latest",
             "1.0.0-rc",
             "1.0.0-0-gGGGGGGG",  # uppercase not allowed in hash
+            "1.0.0-5-gabcdef-rc1",  # rc must precede the snapshot suffix
+            "1.0.0-rc1-rc2",
         ],
     )
     def test_invalid_versions(self, version: str):
         assert not is_orderable_version(version)
 
 
+class TestVersionMatcherPattern:
+    @pytest.mark.parametrize("matcher", ["1.x.x", "1.2.x", "x.x.x", "2.0.0", "10.20.30"])
+    def test_valid_matchers(self, matcher: str):
+        assert VERSION_MATCHER_PATTERN.match(matcher)
+
+    @pytest.mark.parametrize("matcher", ["", "1.x", "1.x.x-rc1", "1.X.x", "v1.x.x"])
+    def test_invalid_matchers(self, matcher: str):
+        assert not VERSION_MATCHER_PATTERN.match(matcher)
+
+
 class TestIsValidProductGroup:
     @pytest.mark.parametrize(
         "group",
@@ -124,6 +139,17 @@ class TestProductDependency:
         )
         assert dep.product_id == "com.example:database"
 
+    def test_stored_product_id_excluded_from_eq_and_repr(self):
+        kwargs = dict(product_group="com.example", product_name="database", minimum_version="1.0.0")
+        dep = ProductDependency(**kwargs)
+        assert dep == ProductDependency(**kwargs)
+        assert hash(dep) == hash(ProductDependency(**kwargs))
+        assert "_product_id" not in repr(dep)
+
+    def test_uses_slots(self):
+        dep = ProductDependency("com.example", "database", "1.0.0")
+        assert not hasattr(dep, "__dict__")
+
     def test_to_manifest_dict_minimal(self):
         dep = ProductDependency(
             product_group="com.example",
@@ -226,6 +252,37 @@ class TestManifestData:
         assert result["extensions"]["product-dependencies"][0]["product-name"] == "database"
         assert len(result["extensions"]["artifacts"]) == 1
 
+    def test_mapping_fields_not_copied(self):
+        labels = FrozenDict({"team": "platform"})
+        replication = FrozenDict({"desired": 2})
+        data = ManifestData(
+            manifest_version="1.0",
+            product_type="helm.v1",
+            product_group="com.example",
+            product_name="my-service",
+            product_version="1.0.0",
+            labels=labels,
+            replication=replication,
+        )
+        result = data.to_dict()
+        assert result["labels"] is labels
+        assert result["replication"] is replication
+
+    def test_collection_fields_not_copied(self):
+        endpoints = (FrozenDict({"name": "http", "port": 8080}),)
+        data = ManifestData(
+            manifest_version="1.0",
+            product_type="helm.v1",
+            product_group="com.example",
+            product_name="my-service",
+            product_version="1.0.0",
+            endpoints=endpoints,
+        )
+        result = data.to_dict()
+        assert result["endpoints"] is endpoints
+        assert "volumes" not in result
+        assert "secrets" not in result
+
     def test_extensions_not_included_when_empty(self):
         data = ManifestData(
             manifest_version="1.0",
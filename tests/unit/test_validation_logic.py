@@ -158,6 +158,17 @@ class TestValidateManifestData:
         errors, warnings = validate_manifest_data(data)
         assert len(errors) >= 4
 
+    def test_skip_identity_checks(self):
+        data = ManifestData(
+            manifest_version="1.0",
+            product_type="",
+            product_group="",
+            product_name="",
+            product_version="not-a-version",
+        )
+        errors, _ = validate_manifest_data(data, validate_identity=False)
+        assert errors == ["product-type is required"]
+
     def test_invalid_product_type(self):
         data = ManifestData(
             manifest_version="1.0",
@@ -186,6 +197,25 @@ class TestValidateManifestData:
         errors, _ = validate_manifest_data(data)
         assert any("Duplicate" in e for e in errors)
 
+    def test_duplicate_dependency_reported_once_with_count(self):
+        dep = ProductDependency(
+            product_group="com.example",
+            product_name="database",
+            minimum_version="1.0.0",
+        )
+        data = ManifestData(
+            manifest_version="1.0",
+            product_type="helm.v1",
+            product_group="com.example",
+            product_name="my-service",
+            product_version="1.0.0",
+            product_dependencies=(dep, dep, dep),
+        )
+        errors, _ = validate_manifest_data(data)
+        assert [e for e in errors if "Duplicate" in e] == [
+            "Duplicate product dependency: com.example:database (appears 3 times)"
+        ]
+
     def test_lockstep_dependency_detected(self):
         dep = ProductDependency(
             product_group="com.example",